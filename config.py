@@ -238,6 +238,10 @@ WEATHER_SAT_MIN_ELEVATION = _get_env_float('WEATHER_SAT_MIN_ELEVATION', 15.0)
 WEATHER_SAT_PREDICTION_HOURS = _get_env_int('WEATHER_SAT_PREDICTION_HOURS', 24)
 WEATHER_SAT_SCHEDULE_REFRESH_MINUTES = _get_env_int('WEATHER_SAT_SCHEDULE_REFRESH_MINUTES', 30)
 WEATHER_SAT_CAPTURE_BUFFER_SECONDS = _get_env_int('WEATHER_SAT_CAPTURE_BUFFER_SECONDS', 30)
+# Internal nginx location aliased to the decoded image directory, e.g.
+# '/_protected_images/'. When set, images are handed off with X-Accel-Redirect
+# so the proxy sends the file itself; empty serves them from Flask.
+WEATHER_SAT_X_ACCEL_PREFIX = _get_env('WEATHER_SAT_X_ACCEL_PREFIX', '')
 
 # SubGHz transceiver settings (HackRF)
 SUBGHZ_DEFAULT_FREQUENCY = _get_env_float('SUBGHZ_FREQUENCY', 433.92)
@@ -26,7 +26,7 @@ if sys.version_info < (3, 9):
     sys.exit(1)
 
 # Handle --version early before other imports
-if '--version' in sys.argv or '-V' in sys.argv:
+if not {'--version', '-V'}.isdisjoint(sys.argv[1:]):
     from config import VERSION
     print(f"INTERCEPT v{VERSION}")
     sys.exit(0)
@@ -39,7 +39,12 @@ if not site.ENABLE_USER_SITE:
     if user_site and user_site not in sys.path:
         sys.path.insert(0, user_site)
 
-from app import main
+
+def main():
+    """Console entry point; imports the Flask app only when it is needed."""
+    from app import main as app_main
+    app_main()
+
 
 if __name__ == '__main__':
     main()
@@ -10,8 +10,11 @@ Supports multiple connection types:
 
 from __future__ import annotations
 
-import queue
+import json
+import threading
 import time
+from collections import deque
+from itertools import islice
 from typing import Generator
 
 from flask import Blueprint, jsonify, request, Response
@@ -30,32 +33,174 @@ logger = get_logger('intercept.meshtastic')
 
 meshtastic_bp = Blueprint('meshtastic', __name__, url_prefix='/meshtastic')
 
-# Queue for SSE message streaming
-_mesh_queue: queue.Queue = queue.Queue(maxsize=500)
+
+# Per-stream backlog; the oldest messages are dropped when a client falls behind
+SSE_STREAM_BACKLOG = 512
+
+# Maximum queued messages sent in one SSE write
+SSE_MAX_BATCH = 64
+
+_SSE_HEADERS = (
+    ('Content-Type', 'text/event-stream'),
+    ('Cache-Control', 'no-cache'),
+    ('X-Accel-Buffering', 'no'),
+    ('Connection', 'keep-alive'),
+)
+
+_KEEPALIVE_SSE = format_sse({'type': 'keepalive'}).encode('utf-8')
+
+# Short-lived caches for device lookups polled by the UI
+DEVICE_CACHE_TTL = 0.5
+_node_cache: dict = {'client': None, 'ts': 0.0, 'val': None}
+_channels_cache: dict = {'client': None, 'ts': 0.0, 'val': None}
+# Channel config only changes through configure_channel, so no TTL
+_channels_serialized_cache: dict = {'client': None, 'val': None}
+
+# Pre-encoded bodies for the most common rejections
+_ERR_NOT_CONNECTED = json.dumps({
+    'status': 'error',
+    'message': 'Not connected to Meshtastic device'
+}).encode('utf-8')
+_ERR_SDK_MISSING = json.dumps({
+    'status': 'error',
+    'message': 'Meshtastic SDK not installed'
+}).encode('utf-8')
+
+# SDK availability is fixed at import time
+_MESH_AVAILABLE = is_meshtastic_available()
 
 # Store recent messages for history
-_recent_messages: list[dict] = []
 MAX_HISTORY = 500
 
 
-def _message_callback(msg: MeshtasticMessage) -> None:
-    """Callback to queue messages for SSE stream."""
-    msg_dict = msg.to_dict()
+class _MeshBuffer:
+    """
+    Received-message state shared by the device callback and the handlers.
+
+    Holds the message history as MeshtasticMessage.to_dict() dicts (the raw
+    packet is not kept), the same history indexed by channel (0-7), and one
+    bounded backlog per connected SSE stream, keyed by that stream's wakeup
+    event. on_msg is passed to the client as a bound method.
+    """
 
-    # Add to history
-    _recent_messages.append(msg_dict)
-    if len(_recent_messages) > MAX_HISTORY:
-        _recent_messages.pop(0)
+    __slots__ = ('hist', 'hist_by_ch', 'streams', 'streams_lock', 'backlog')
 
-    # Queue for SSE
+    def __init__(self, backlog: int = SSE_STREAM_BACKLOG, max_history: int = MAX_HISTORY):
+        self.hist: deque[dict] = deque(maxlen=max_history)
+        self.hist_by_ch: dict[int, deque[dict]] = {
+            i: deque(maxlen=max_history) for i in range(8)
+        }
+        self.streams: dict[threading.Event, deque[bytes]] = {}
+        self.streams_lock = threading.Lock()
+        self.backlog = backlog
+
+    def on_msg(self, msg: MeshtasticMessage) -> None:
+        """Record a received message and queue it for every SSE stream."""
+        data = msg.to_dict()
+        self.hist.append(data)
+        channel_deque = self.hist_by_ch.get(msg.channel)
+        if channel_deque is not None:
+            channel_deque.append(data)
+
+        # Serialized once here rather than in each stream
+        payload = format_sse(data).encode('utf-8')
+        with self.streams_lock:
+            streams = tuple(self.streams.items())
+        for wakeup, queue in streams:
+            queue.append(payload)
+            wakeup.set()
+
+    def subscribe(self) -> tuple[deque[bytes], threading.Event]:
+        """Register an SSE stream and return its backlog and wakeup event."""
+        queue: deque[bytes] = deque(maxlen=self.backlog)
+        wakeup = threading.Event()
+        with self.streams_lock:
+            self.streams[wakeup] = queue
+        return queue, wakeup
+
+    def unsubscribe(self, wakeup: threading.Event) -> None:
+        """Remove an SSE stream registered with subscribe()."""
+        with self.streams_lock:
+            self.streams.pop(wakeup, None)
+
+    def clear(self) -> None:
+        """Drop queued and historical messages."""
+        with self.streams_lock:
+            queues = tuple(self.streams.values())
+        for queue in queues:
+            queue.clear()
+        self.hist.clear()
+        for channel_deque in self.hist_by_ch.values():
+            channel_deque.clear()
+
+
+_buf = _MeshBuffer()
+
+
+def _json_error(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a pre-encoded body."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _json_body() -> dict:
+    """Parse a small JSON request body, returning {} if absent or invalid."""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
     try:
-        _mesh_queue.put_nowait(msg_dict)
-    except queue.Full:
-        try:
-            _mesh_queue.get_nowait()
-            _mesh_queue.put_nowait(msg_dict)
-        except queue.Empty:
-            pass
+        data = json.loads(raw)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _strip_str(value) -> str:
+    """Strip a JSON value, only coercing to str when it is not one already."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+def _require_client():
+    """Return the Meshtastic client if it is connected, otherwise None."""
+    client = get_meshtastic_client()
+    return client if client and client.is_running else None
+
+
+def _cached_call(cache: dict, client, fetch, ttl: float):
+    """Return fetch(client), reusing the value cached for this client within ttl seconds."""
+    now = time.monotonic()
+    if cache['client'] is client and cache['val'] is not None and now - cache['ts'] < ttl:
+        return cache['val']
+    val = fetch(client)
+    cache.update(client=client, ts=now, val=val)
+    return val
+
+
+def _cached_node(client, ttl: float = DEVICE_CACHE_TTL):
+    """Return client.get_node_info(), cached for ttl seconds."""
+    return _cached_call(_node_cache, client, lambda c: c.get_node_info(), ttl)
+
+
+def _cached_channels(client, ttl: float = DEVICE_CACHE_TTL):
+    """Return client.get_channels(), cached for ttl seconds."""
+    return _cached_call(_channels_cache, client, lambda c: c.get_channels(), ttl)
+
+
+def _serialized_channels(client) -> list[dict]:
+    """Return the channel list as dicts, rebuilt only after invalidation."""
+    if _channels_serialized_cache['client'] is client and _channels_serialized_cache['val'] is not None:
+        return _channels_serialized_cache['val']
+    val = [ch.to_dict() for ch in _cached_channels(client)]
+    _channels_serialized_cache.update(client=client, val=val)
+    return val
+
+
+def _invalidate_device_cache() -> None:
+    """Force the next node/channel lookup to hit the device."""
+    _node_cache['val'] = None
+    _channels_cache['val'] = None
+    _channels_serialized_cache['val'] = None
 
 
 @meshtastic_bp.route('/ports')
@@ -66,7 +211,7 @@ def list_ports():
     Returns:
         JSON with list of available serial ports.
     """
-    if not is_meshtastic_available():
+    if not _MESH_AVAILABLE:
         return jsonify({
             'status': 'error',
             'ports': [],
@@ -98,7 +243,7 @@ def get_status():
     Returns:
         JSON with connection status, device info, connection type, and node information.
     """
-    if not is_meshtastic_available():
+    if not _MESH_AVAILABLE:
         return jsonify({
             'available': False,
             'running': False,
@@ -116,11 +261,12 @@ def get_status():
             'node_info': None,
         })
 
-    node_info = client.get_node_info() if client.is_running else None
+    running = client.is_running
+    node_info = _cached_node(client) if running else None
 
     return jsonify({
         'available': True,
-        'running': client.is_running,
+        'running': running,
         'device': client.device_path,
         'connection_type': client.connection_type,
         'error': client.error,
@@ -151,14 +297,14 @@ def start_mesh():
     Returns:
         JSON with connection status.
     """
-    if not is_meshtastic_available():
+    if not _MESH_AVAILABLE:
         return jsonify({
             'status': 'error',
             'message': 'Meshtastic SDK not installed. Install with: pip install meshtastic'
         }), 400
 
-    client = get_meshtastic_client()
-    if client and client.is_running:
+    client = _require_client()
+    if client is not None:
         return jsonify({
             'status': 'already_running',
             'device': client.device_path,
@@ -166,15 +312,11 @@ def start_mesh():
         })
 
     # Clear queue and history
-    while not _mesh_queue.empty():
-        try:
-            _mesh_queue.get_nowait()
-        except queue.Empty:
-            break
-    _recent_messages.clear()
+    _buf.clear()
+    _invalidate_device_cache()
 
     # Parse connection parameters
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     connection_type = data.get('connection_type', 'serial').lower().strip()
     device = data.get('device')
     hostname = data.get('hostname')
@@ -193,7 +335,7 @@ def start_mesh():
                 'status': 'error',
                 'message': 'hostname is required for TCP connections'
             }), 400
-        hostname = str(hostname).strip()
+        hostname = _strip_str(hostname)
         if not hostname:
             return jsonify({
                 'status': 'error',
@@ -202,21 +344,21 @@ def start_mesh():
 
     # Validate serial device path if provided
     if device:
-        device = str(device).strip()
+        device = _strip_str(device)
         if not device:
             device = None
 
     # Start client
     success = start_meshtastic(
         device=device,
-        callback=_message_callback,
+        callback=_buf.on_msg,
         connection_type=connection_type,
         hostname=hostname
     )
 
     if success:
         client = get_meshtastic_client()
-        node_info = client.get_node_info() if client else None
+        node_info = _cached_node(client) if client else None
         return jsonify({
             'status': 'started',
             'device': client.device_path if client else None,
@@ -242,6 +384,7 @@ def stop_mesh():
         JSON confirmation.
     """
     stop_meshtastic()
+    _invalidate_device_cache()
     return jsonify({'status': 'stopped'})
 
 
@@ -254,18 +397,14 @@ def get_channels():
         JSON with list of channel configurations.
         Note: PSK values are not returned for security - only encryption status.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    channels = client.get_channels()
+    channels = _serialized_channels(client)
     return jsonify({
         'status': 'ok',
-        'channels': [ch.to_dict() for ch in channels],
+        'channels': channels,
         'count': len(channels)
     })
 
@@ -302,13 +441,9 @@ def configure_channel(index: int):
         The "default" key is publicly known (shipped in source code).
         Use "random" or provide your own key for secure communications.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
     if not 0 <= index <= 7:
         return jsonify({
@@ -316,7 +451,7 @@ def configure_channel(index: int):
             'message': 'Channel index must be 0-7'
         }), 400
 
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     name = data.get('name')
     psk = data.get('psk')
 
@@ -328,17 +463,18 @@ def configure_channel(index: int):
 
     # Sanitize name if provided
     if name:
-        name = str(name).strip()[:12]  # Meshtastic channel names max 12 chars
+        name = _strip_str(name)[:12]  # Meshtastic channel names max 12 chars
 
     # Validate PSK format if provided
     if psk:
-        psk = str(psk).strip()
+        psk = _strip_str(psk)
 
     success, message = client.set_channel(index, name=name, psk=psk)
+    _invalidate_device_cache()
 
     if success:
         # Return updated channel info
-        channels = client.get_channels()
+        channels = _cached_channels(client)
         updated = next((ch for ch in channels if ch.index == index), None)
         return jsonify({
             'status': 'ok',
@@ -367,21 +503,14 @@ def send_message():
     Returns:
         JSON with send status.
     """
-    if not is_meshtastic_available():
-        return jsonify({
-            'status': 'error',
-            'message': 'Meshtastic SDK not installed'
-        }), 400
+    if not _MESH_AVAILABLE:
+        return _json_error(_ERR_SDK_MISSING, 400)
 
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     text = data.get('text', '').strip()
 
     if not text:
@@ -436,15 +565,17 @@ def get_messages():
     limit = request.args.get('limit', type=int)
     channel = request.args.get('channel', type=int)
 
-    messages = _recent_messages.copy()
-
-    # Filter by channel if specified
     if channel is not None:
-        messages = [m for m in messages if m.get('channel') == channel]
+        source = _buf.hist_by_ch.get(channel, ())
+    else:
+        source = _buf.hist
 
-    # Apply limit
+    # Only walk the tail that is actually returned
     if limit and limit > 0:
-        messages = messages[-limit:]
+        messages = list(islice(reversed(source), limit))
+        messages.reverse()
+    else:
+        messages = list(source)
 
     return jsonify({
         'status': 'ok',
@@ -469,26 +600,39 @@ def stream_messages():
     Returns:
         SSE stream (text/event-stream)
     """
-    def generate() -> Generator[str, None, None]:
-        last_keepalive = time.time()
+    def generate() -> Generator[bytes, None, None]:
         keepalive_interval = 30.0
+        next_keepalive = time.monotonic() + keepalive_interval
+        buf = _buf
+        queue, wakeup = buf.subscribe()
 
-        while True:
-            try:
-                msg = _mesh_queue.get(timeout=1)
-                last_keepalive = time.time()
-                yield format_sse(msg)
-            except queue.Empty:
-                now = time.time()
-                if now - last_keepalive >= keepalive_interval:
-                    yield format_sse({'type': 'keepalive'})
-                    last_keepalive = now
-
-    response = Response(generate(), mimetype='text/event-stream')
-    response.headers['Cache-Control'] = 'no-cache'
-    response.headers['X-Accel-Buffering'] = 'no'
-    response.headers['Connection'] = 'keep-alive'
-    return response
+        try:
+            while True:
+                # Clear before draining so a push during the drain re-arms it
+                wakeup.clear()
+                # Coalesce a burst into a single write
+                batch = []
+                try:
+                    while len(batch) < SSE_MAX_BATCH:
+                        batch.append(queue.popleft())
+                except IndexError:
+                    pass
+                if batch:
+                    next_keepalive = time.monotonic() + keepalive_interval
+                    yield b''.join(batch)
+                    # Loop back to drain whatever is left before waiting
+                    continue
+
+                now = time.monotonic()
+                if now >= next_keepalive:
+                    yield _KEEPALIVE_SSE
+                    next_keepalive = now + keepalive_interval
+                    continue
+                wakeup.wait(next_keepalive - now)
+        finally:
+            buf.unsubscribe(wakeup)
+
+    return Response(generate(), headers=_SSE_HEADERS, direct_passthrough=True)
 
 
 @meshtastic_bp.route('/node')
@@ -502,15 +646,11 @@ def get_node():
     Returns:
         JSON with node information.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    node_info = client.get_node_info()
+    node_info = _cached_node(client)
 
     if node_info:
         return jsonify({
@@ -538,9 +678,8 @@ def get_nodes():
     Returns:
         JSON with list of nodes.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -577,21 +716,14 @@ def send_traceroute():
     Returns:
         JSON with traceroute request status.
     """
-    if not is_meshtastic_available():
-        return jsonify({
-            'status': 'error',
-            'message': 'Meshtastic SDK not installed'
-        }), 400
+    if not _MESH_AVAILABLE:
+        return _json_error(_ERR_SDK_MISSING, 400)
 
-    client = get_meshtastic_client()
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
-
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     destination = data.get('destination')
 
     if not destination:
@@ -630,9 +762,8 @@ def get_traceroute_results():
     Returns:
         JSON with list of traceroute results.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -662,21 +793,14 @@ def request_position():
     Returns:
         JSON with request status.
     """
-    if not is_meshtastic_available():
-        return jsonify({
-            'status': 'error',
-            'message': 'Meshtastic SDK not installed'
-        }), 400
-
-    client = get_meshtastic_client()
+    if not _MESH_AVAILABLE:
+        return _json_error(_ERR_SDK_MISSING, 400)
 
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     node_id = data.get('node_id')
 
     if not node_id:
@@ -707,13 +831,9 @@ def check_firmware():
     Returns:
         JSON with current_version, latest_version, update_available, release_url.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
     result = client.check_firmware()
     result['status'] = 'ok'
@@ -731,13 +851,9 @@ def get_channel_qr(index: int):
     Returns:
         PNG image of QR code.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
     if not 0 <= index <= 7:
         return jsonify({
@@ -768,9 +884,8 @@ def get_telemetry_history():
     Returns:
         JSON with telemetry data points.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -822,9 +937,8 @@ def get_neighbors():
     Returns:
         JSON with neighbor relationships.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -870,9 +984,8 @@ def get_pending_messages():
     Returns:
         JSON with pending messages and their status.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -902,21 +1015,14 @@ def start_range_test():
     Returns:
         JSON with start status.
     """
-    if not is_meshtastic_available():
-        return jsonify({
-            'status': 'error',
-            'message': 'Meshtastic SDK not installed'
-        }), 400
+    if not _MESH_AVAILABLE:
+        return _json_error(_ERR_SDK_MISSING, 400)
 
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     count = data.get('count', 10)
     interval = data.get('interval', 5)
 
@@ -965,9 +1071,8 @@ def get_range_test_status():
     Returns:
         JSON with running status and results.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -990,9 +1095,8 @@ def get_store_forward_status():
     Returns:
         JSON with availability status and router info.
     """
-    client = get_meshtastic_client()
-
-    if not client or not client.is_running:
+    client = _require_client()
+    if client is None:
         return jsonify({
             'status': 'error',
             'message': 'Not connected to Meshtastic device',
@@ -1019,21 +1123,14 @@ def request_store_forward():
     Returns:
         JSON with request status.
     """
-    if not is_meshtastic_available():
-        return jsonify({
-            'status': 'error',
-            'message': 'Meshtastic SDK not installed'
-        }), 400
-
-    client = get_meshtastic_client()
+    if not _MESH_AVAILABLE:
+        return _json_error(_ERR_SDK_MISSING, 400)
 
-    if not client or not client.is_running:
-        return jsonify({
-            'status': 'error',
-            'message': 'Not connected to Meshtastic device'
-        }), 400
+    client = _require_client()
+    if client is None:
+        return _json_error(_ERR_NOT_CONNECTED, 400)
 
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     window_minutes = data.get('window_minutes', 60)
 
     if not isinstance(window_minutes, int) or window_minutes < 1 or window_minutes > 1440:
@@ -1,6 +1,16 @@
 """Spy Stations routes - Number stations and diplomatic HF networks."""
 
-from flask import Blueprint, jsonify, request
+from __future__ import annotations
+
+import functools
+import gzip
+import hashlib
+import sys
+from typing import NamedTuple
+
+from flask import Blueprint, request
+
+from utils.responses import dumps_json, json_response
 
 spy_stations_bp = Blueprint('spy_stations', __name__, url_prefix='/spy-stations')
 
@@ -566,60 +576,196 @@ STATIONS = [
 ]
 
 
-@spy_stations_bp.route('/stations')
-def get_stations():
-    """Return all spy stations, optionally filtered."""
-    station_type = request.args.get('type')
-    country = request.args.get('country')
-    mode = request.args.get('mode')
+def _build_index(column: list[str]) -> dict[str, tuple[int, ...]]:
+    """Map each value in a column to its positions, in ascending order."""
+    index: dict[str, list[int]] = {}
+    for i, value in enumerate(column):
+        index.setdefault(value, []).append(i)
+    return {value: tuple(positions) for value, positions in index.items()}
+
+
+# Categorical fields repeat across stations; share one str object per value
+for _station in STATIONS:
+    for _field in ('type', 'country', 'country_code', 'mode', 'operator'):
+        _station[_field] = sys.intern(_station[_field])
+del _station, _field
+
+# Filter fields as parallel columns (one entry per station), built once
+# since STATIONS never changes at runtime
+_TYPES = [s['type'] for s in STATIONS]
+_COUNTRY_CODES = [sys.intern(s['country_code'].upper()) for s in STATIONS]
+_MODES_LOWER = [sys.intern(s['mode'].lower()) for s in STATIONS]
+
+# Inverted indices over the exact-match columns; positions are kept sorted
+# so matches come out in source order without a per-request sort
+_ALL_INDICES = range(len(STATIONS))
+_BY_TYPE = _build_index(_TYPES)
+_BY_COUNTRY = _build_index(_COUNTRY_CODES)
+_BY_ID = {s['id']: s for s in STATIONS}
+
+
+def _etag(body: bytes) -> str:
+    """Content hash used as a strong ETag."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class _Payload(NamedTuple):
+    """A pre-encoded response body with its ETag and optional gzip form."""
+    body: bytes
+    etag: str
+    gzipped: bytes | None = None
+
+
+# Bodies smaller than this are not worth a Content-Encoding round trip
+_GZIP_MIN_SIZE = 1024
+
+
+def _payload(body: bytes, precompress: bool = False) -> _Payload:
+    """Wrap a body with its ETag, gzipping it once up front if requested."""
+    gzipped = None
+    if precompress and len(body) >= _GZIP_MIN_SIZE:
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+    return _Payload(body, _etag(body), gzipped)
+
+
+def _conditional_response(payload: _Payload):
+    """Serve a payload with an ETag, answering 304 when the client has it."""
+    if payload.gzipped is not None and request.accept_encodings.quality('gzip') > 0:
+        response = json_response(payload.gzipped)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(f'{payload.etag}-gzip')
+    else:
+        response = json_response(payload.body)
+        response.set_etag(payload.etag)
+    if payload.gzipped is not None:
+        response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response.make_conditional(request)
+
+
+def _build_filters() -> dict:
+    """Collect the distinct types, countries and modes in STATIONS."""
+    types = sorted(set(s['type'] for s in STATIONS))
+    countries = sorted(set((s['country'], s['country_code']) for s in STATIONS))
+    modes = sorted(set(s['mode'].split('/')[0] for s in STATIONS))
+
+    return {
+        'status': 'success',
+        'filters': {
+            'types': types,
+            'countries': [{'name': c[0], 'code': c[1]} for c in countries],
+            'modes': modes
+        }
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _mode_matches(mode: str) -> frozenset[int]:
+    """Positions of stations whose lower-case mode contains the query."""
+    return frozenset(i for i, m in enumerate(_MODES_LOWER) if mode in m)
+
 
-    filtered = STATIONS
+def _filter_positions(
+    station_type: str | None,
+    country: str | None,
+    mode: str | None,
+) -> tuple[int, ...]:
+    """
+    Select the positions of stations matching all given filters, ascending.
 
+    Args:
+        station_type: Exact station type
+        country: Upper-case country code
+        mode: Lower-case substring of the mode
+    """
+    if not (station_type or country or mode):
+        return tuple(_ALL_INDICES)
+
+    # Walk the narrowest exact-match index once, checking the rest inline
     if station_type:
-        filtered = [s for s in filtered if s['type'] == station_type]
+        candidates = _BY_TYPE.get(station_type, ())
+    elif country:
+        candidates = _BY_COUNTRY.get(country, ())
+    else:
+        candidates = _ALL_INDICES
+    mode_hits = _mode_matches(mode) if mode else None
 
-    if country:
-        filtered = [s for s in filtered if s['country_code'].upper() == country.upper()]
+    return tuple(
+        i for i in candidates
+        if (not country or _COUNTRY_CODES[i] == country)
+        and (mode_hits is None or i in mode_hits)
+    )
 
-    if mode:
-        mode_lower = mode.lower()
-        filtered = [s for s in filtered if mode_lower in s['mode'].lower()]
 
-    return jsonify({
+def _encode_stations(positions: tuple[int, ...]) -> bytes:
+    """Encode a /stations response body."""
+    return dumps_json({
         'status': 'success',
-        'count': len(filtered),
-        'stations': filtered
+        'count': len(positions),
+        'stations': [STATIONS[i] for i in positions]
     })
 
 
+_FILTERS_PAYLOAD = _payload(dumps_json(_build_filters()), precompress=True)
+
+# The unfiltered list and every single type/country filter, gzipped once at
+# import; a plain dict so ad-hoc queries can never evict them
+_PINNED_STATIONS_PAYLOADS: dict[tuple[str | None, str | None, str | None], _Payload] = {
+    key: _payload(_encode_stations(_filter_positions(*key)), precompress=True)
+    for key in ([(None, None, None)]
+                + [(t, None, None) for t in _BY_TYPE]
+                + [(None, c, None) for c in _BY_COUNTRY])
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _filtered_payload(positions: tuple[int, ...]) -> _Payload:
+    """
+    Encoded /stations body for any other filter combination.
+
+    Keyed by the matching positions rather than the raw query, so unknown
+    or junk filter values share an entry with every query that selects
+    the same stations. Not precompressed, to keep gzip off the request
+    thread.
+    """
+    return _payload(_encode_stations(positions))
+
+
+_STATION_RESPONSES: dict[str, _Payload] = {
+    station_id: _payload(dumps_json({'status': 'success', 'station': station}))
+    for station_id, station in _BY_ID.items()
+}
+
+_NOT_FOUND_BODY = dumps_json({
+    'status': 'error',
+    'message': 'Station not found'
+})
+
+
+@spy_stations_bp.route('/stations')
+def get_stations():
+    """Return all spy stations, optionally filtered."""
+    station_type = request.args.get('type') or None
+    country = (request.args.get('country') or '').upper() or None
+    mode = (request.args.get('mode') or '').lower() or None
+
+    payload = _PINNED_STATIONS_PAYLOADS.get((station_type, country, mode))
+    if payload is None:
+        payload = _filtered_payload(_filter_positions(station_type, country, mode))
+    return _conditional_response(payload)
+
+
 @spy_stations_bp.route('/stations/<station_id>')
 def get_station(station_id):
     """Get a single station by ID."""
-    for station in STATIONS:
-        if station['id'] == station_id:
-            return jsonify({
-                'status': 'success',
-                'station': station
-            })
+    cached = _STATION_RESPONSES.get(station_id)
+    if cached is None:
+        return json_response(_NOT_FOUND_BODY, 404)
 
-    return jsonify({
-        'status': 'error',
-        'message': 'Station not found'
-    }), 404
+    return _conditional_response(cached)
 
 
 @spy_stations_bp.route('/filters')
 def get_filters():
     """Return available filter options."""
-    types = list(set(s['type'] for s in STATIONS))
-    countries = sorted(list(set((s['country'], s['country_code']) for s in STATIONS)))
-    modes = sorted(list(set(s['mode'].split('/')[0] for s in STATIONS)))
-
-    return jsonify({
-        'status': 'success',
-        'filters': {
-            'types': types,
-            'countries': [{'name': c[0], 'code': c[1]} for c in countries],
-            'modes': modes
-        }
-    })
+    return _conditional_response(_FILTERS_PAYLOAD)
@@ -6,12 +6,20 @@ from NOAA (APT) and Meteor (LRPT) satellites using SatDump.
 
 from __future__ import annotations
 
-import queue
+import os
+import re
+import threading
+import time
+from collections import deque
+from itertools import islice
 
-from flask import Blueprint, jsonify, request, Response, send_file
+from flask import Blueprint, request, Response, send_from_directory
+from werkzeug.exceptions import NotFound
 
+from config import WEATHER_SAT_X_ACCEL_PREFIX
 from utils.logging import get_logger
-from utils.sse import sse_stream
+from utils.responses import dumps_json, json_response
+from utils.sse import format_sse
 from utils.validation import validate_device_index, validate_gain, validate_latitude, validate_longitude, validate_elevation
 from utils.weather_sat import (
     get_weather_sat_decoder,
@@ -19,25 +27,95 @@ from utils.weather_sat import (
     CaptureProgress,
     WEATHER_SATELLITES,
 )
+from utils.weather_sat_predict import SKYFIELD_AVAILABLE, predict_passes
 
 logger = get_logger('intercept.weather_sat')
 
 weather_sat_bp = Blueprint('weather_sat', __name__, url_prefix='/weather-sat')
 
-# Queue for SSE progress streaming
-_weather_sat_queue: queue.Queue = queue.Queue(maxsize=100)
+# Connected SSE clients, each with its own bounded event deque (oldest
+# events are dropped when a slow client falls behind) and wakeup event
+_subscribers: list[tuple[deque, threading.Event]] = []
+_subscribers_lock = threading.Lock()
+
+# Per-client backlog and seconds an idle stream waits before a keepalive
+SSE_SUBSCRIBER_MAXLEN = 256
+SSE_KEEPALIVE_INTERVAL = 30.0
+
+_KEEPALIVE_SSE = format_sse({'type': 'keepalive'})
+
+
+def _publish(event: dict) -> None:
+    """Broadcast an event to every connected SSE client.
+
+    The event is formatted once here so each stream only forwards the
+    ready-to-send message.
+    """
+    message = format_sse(event)
+    with _subscribers_lock:
+        subscribers = tuple(_subscribers)
+    for events, wakeup in subscribers:
+        events.append(message)
+        wakeup.set()
+
+
+# Safe image filenames: ASCII letters, digits, '_', '-' and '.', not starting
+# with a dot or dash so '..' and option-like names are rejected
+_FILENAME_RE = re.compile(r'[A-Za-z0-9_][A-Za-z0-9_.\-]*')
+
+# Seconds clients may reuse a decoded image before revalidating
+IMAGE_CACHE_MAX_AGE = 3600
+
+_IMAGE_MIMETYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+}
+
+# WEATHER_SATELLITES is static, so the /satellites body is encoded once
+_SATELLITES_BODY = dumps_json({
+    'status': 'ok',
+    'satellites': [
+        {
+            'key': key,
+            'name': info['name'],
+            'frequency': info['frequency'],
+            'mode': info['mode'],
+            'description': info['description'],
+            'active': info['active'],
+        }
+        for key, info in WEATHER_SATELLITES.items()
+    ],
+})
+
+
+# app.py owns the SDR device registry; it is resolved on first use since
+# app.py imports this module, and stays None when the app is not loaded
+_app_module = None
+
+
+def _get_app_module():
+    """Return the app module for SDR device claims, or None if unavailable."""
+    global _app_module
+    if _app_module is None:
+        try:
+            import app
+        except ImportError:
+            return None
+        _app_module = app
+    return _app_module
+
+
+def _release_sdr_device(device_index: int) -> None:
+    """Release an SDR device claimed for weather satellite capture."""
+    app_module = _get_app_module()
+    if app_module is not None:
+        app_module.release_sdr_device(device_index)
 
 
 def _progress_callback(progress: CaptureProgress) -> None:
     """Callback to queue progress updates for SSE stream."""
-    try:
-        _weather_sat_queue.put_nowait(progress.to_dict())
-    except queue.Full:
-        try:
-            _weather_sat_queue.get_nowait()
-            _weather_sat_queue.put_nowait(progress.to_dict())
-        except queue.Empty:
-            pass
+    _publish(progress.to_dict())
 
 
 @weather_sat_bp.route('/status')
@@ -48,7 +126,7 @@ def get_status():
         JSON with decoder availability and current status.
     """
     decoder = get_weather_sat_decoder()
-    return jsonify(decoder.get_status())
+    return json_response(decoder.get_status())
 
 
 @weather_sat_bp.route('/satellites')
@@ -58,21 +136,7 @@ def list_satellites():
     Returns:
         JSON with satellite definitions.
     """
-    satellites = []
-    for key, info in WEATHER_SATELLITES.items():
-        satellites.append({
-            'key': key,
-            'name': info['name'],
-            'frequency': info['frequency'],
-            'mode': info['mode'],
-            'description': info['description'],
-            'active': info['active'],
-        })
-
-    return jsonify({
-        'status': 'ok',
-        'satellites': satellites,
-    })
+    return json_response(_SATELLITES_BODY)
 
 
 @weather_sat_bp.route('/start', methods=['POST'])
@@ -91,15 +155,15 @@ def start_capture():
         JSON with start status.
     """
     if not is_weather_sat_available():
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'SatDump not installed. Build from source: https://github.com/SatDump/SatDump'
-        }), 400
+        }, 400)
 
     decoder = get_weather_sat_decoder()
 
     if decoder.is_running:
-        return jsonify({
+        return json_response({
             'status': 'already_running',
             'satellite': decoder.current_satellite,
             'frequency': decoder.current_frequency,
@@ -110,10 +174,10 @@ def start_capture():
     # Validate satellite
     satellite = data.get('satellite')
     if not satellite or satellite not in WEATHER_SATELLITES:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': f'Invalid satellite. Must be one of: {", ".join(WEATHER_SATELLITES.keys())}'
-        }), 400
+        }, 400)
 
     # Validate device index and gain
     try:
@@ -121,42 +185,29 @@ def start_capture():
         gain = validate_gain(data.get('gain', 40.0))
     except ValueError as e:
         logger.warning('Invalid parameter in start_capture: %s', e)
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Invalid parameter value'
-        }), 400
+        }, 400)
 
     bias_t = bool(data.get('bias_t', False))
 
     # Claim SDR device
-    try:
-        import app as app_module
+    app_module = _get_app_module()
+    if app_module is not None:
         error = app_module.claim_sdr_device(device_index, 'weather_sat')
         if error:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'error_type': 'DEVICE_BUSY',
                 'message': error,
-            }), 409
-    except ImportError:
-        pass
-
-    # Clear queue
-    while not _weather_sat_queue.empty():
-        try:
-            _weather_sat_queue.get_nowait()
-        except queue.Empty:
-            break
+            }, 409)
 
     # Set callback and on-complete handler for SDR release
     decoder.set_callback(_progress_callback)
 
     def _release_device():
-        try:
-            import app as app_module
-            app_module.release_sdr_device(device_index)
-        except ImportError:
-            pass
+        _release_sdr_device(device_index)
 
     decoder.set_on_complete(_release_device)
 
@@ -169,7 +220,7 @@ def start_capture():
 
     if success:
         sat_info = WEATHER_SATELLITES[satellite]
-        return jsonify({
+        return json_response({
             'status': 'started',
             'satellite': satellite,
             'frequency': sat_info['frequency'],
@@ -179,10 +230,10 @@ def start_capture():
     else:
         # Release device on failure
         _release_device()
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Failed to start capture'
-        }), 500
+        }, 500)
 
 
 @weather_sat_bp.route('/test-decode', methods=['POST'])
@@ -203,15 +254,15 @@ def test_decode():
         JSON with start status.
     """
     if not is_weather_sat_available():
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'SatDump not installed. Build from source: https://github.com/SatDump/SatDump'
-        }), 400
+        }, 400)
 
     decoder = get_weather_sat_decoder()
 
     if decoder.is_running:
-        return jsonify({
+        return json_response({
             'status': 'already_running',
             'satellite': decoder.current_satellite,
             'frequency': decoder.current_frequency,
@@ -222,18 +273,18 @@ def test_decode():
     # Validate satellite
     satellite = data.get('satellite')
     if not satellite or satellite not in WEATHER_SATELLITES:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': f'Invalid satellite. Must be one of: {", ".join(WEATHER_SATELLITES.keys())}'
-        }), 400
+        }, 400)
 
     # Validate input file
     input_file = data.get('input_file')
     if not input_file:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'input_file is required'
-        }), 400
+        }, 400)
 
     from pathlib import Path
     input_path = Path(input_file)
@@ -243,22 +294,22 @@ def test_decode():
     try:
         resolved = input_path.resolve()
         if not resolved.is_relative_to(allowed_base):
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': 'input_file must be under the data/ directory'
-            }), 403
+            }, 403)
     except (OSError, ValueError):
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Invalid file path'
-        }), 400
+        }, 400)
 
     if not input_path.is_file():
         logger.warning("Test-decode file not found")
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'File not found'
-        }), 404
+        }, 404)
 
     # Validate sample rate
     sample_rate = data.get('sample_rate', 1000000)
@@ -267,17 +318,10 @@ def test_decode():
         if sample_rate < 1000 or sample_rate > 20000000:
             raise ValueError
     except (TypeError, ValueError):
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Invalid sample_rate (1000-20000000)'
-        }), 400
-
-    # Clear queue
-    while not _weather_sat_queue.empty():
-        try:
-            _weather_sat_queue.get_nowait()
-        except queue.Empty:
-            break
+        }, 400)
 
     # Set callback — no on_complete needed (no SDR to release)
     decoder.set_callback(_progress_callback)
@@ -291,7 +335,7 @@ def test_decode():
 
     if success:
         sat_info = WEATHER_SATELLITES[satellite]
-        return jsonify({
+        return json_response({
             'status': 'started',
             'satellite': satellite,
             'frequency': sat_info['frequency'],
@@ -300,10 +344,10 @@ def test_decode():
             'input_file': str(input_file),
         })
     else:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Failed to start file decode'
-        }), 500
+        }, 500)
 
 
 @weather_sat_bp.route('/stop', methods=['POST'])
@@ -319,13 +363,9 @@ def stop_capture():
     decoder.stop()
 
     # Release SDR device
-    try:
-        import app as app_module
-        app_module.release_sdr_device(device_index)
-    except ImportError:
-        pass
+    _release_sdr_device(device_index)
 
-    return jsonify({'status': 'stopped'})
+    return json_response({'status': 'stopped'})
 
 
 @weather_sat_bp.route('/images')
@@ -340,19 +380,18 @@ def list_images():
         JSON with list of decoded images.
     """
     decoder = get_weather_sat_decoder()
-    images = decoder.get_images()
-
-    # Filter by satellite if specified
     satellite_filter = request.args.get('satellite')
-    if satellite_filter:
-        images = [img for img in images if img.satellite == satellite_filter]
-
-    # Apply limit
     limit = request.args.get('limit', type=int)
-    if limit and limit > 0:
-        images = images[-limit:]
 
-    return jsonify({
+    # Walk newest-first, filtering by satellite and stopping once the
+    # limit is reached, then restore oldest-first order
+    images = reversed(decoder.get_images())
+    if satellite_filter:
+        images = (img for img in images if img.satellite == satellite_filter)
+    images = list(islice(images, limit if limit and limit > 0 else None))
+    images.reverse()
+
+    return json_response({
         'status': 'ok',
         'images': [img.to_dict() for img in images],
         'count': len(images),
@@ -372,19 +411,30 @@ def get_image(filename: str):
     decoder = get_weather_sat_decoder()
 
     # Security: only allow safe filenames
-    if not filename.replace('_', '').replace('-', '').replace('.', '').isalnum():
-        return jsonify({'status': 'error', 'message': 'Invalid filename'}), 400
-
-    if not (filename.endswith('.png') or filename.endswith('.jpg') or filename.endswith('.jpeg')):
-        return jsonify({'status': 'error', 'message': 'Only PNG/JPG files supported'}), 400
-
-    image_path = decoder._output_dir / filename
-
-    if not image_path.exists():
-        return jsonify({'status': 'error', 'message': 'Image not found'}), 404
-
-    mimetype = 'image/png' if filename.endswith('.png') else 'image/jpeg'
-    return send_file(image_path, mimetype=mimetype)
+    if not _FILENAME_RE.fullmatch(filename):
+        return json_response({'status': 'error', 'message': 'Invalid filename'}, 400)
+
+    mimetype = _IMAGE_MIMETYPES.get(os.path.splitext(filename)[1])
+    if mimetype is None:
+        return json_response({'status': 'error', 'message': 'Only PNG/JPG files supported'}, 400)
+
+    if WEATHER_SAT_X_ACCEL_PREFIX:
+        if not (decoder._output_dir / filename).exists():
+            return json_response({'status': 'error', 'message': 'Image not found'}, 404)
+        # Let the front proxy stream the file instead of this worker
+        response = Response(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = WEATHER_SAT_X_ACCEL_PREFIX.rstrip('/') + '/' + filename
+        return response
+
+    # Decoded images never change once written, so clients may cache them
+    # and revalidate with the ETag/Last-Modified headers
+    try:
+        return send_from_directory(
+            decoder._output_dir, filename,
+            mimetype=mimetype, conditional=True, max_age=IMAGE_CACHE_MAX_AGE,
+        )
+    except NotFound:
+        return json_response({'status': 'error', 'message': 'Image not found'}, 404)
 
 
 @weather_sat_bp.route('/images/<filename>', methods=['DELETE'])
@@ -399,13 +449,13 @@ def delete_image(filename: str):
     """
     decoder = get_weather_sat_decoder()
 
-    if not filename.replace('_', '').replace('-', '').replace('.', '').isalnum():
-        return jsonify({'status': 'error', 'message': 'Invalid filename'}), 400
+    if not _FILENAME_RE.fullmatch(filename):
+        return json_response({'status': 'error', 'message': 'Invalid filename'}, 400)
 
     if decoder.delete_image(filename):
-        return jsonify({'status': 'deleted', 'filename': filename})
+        return json_response({'status': 'deleted', 'filename': filename})
     else:
-        return jsonify({'status': 'error', 'message': 'Image not found'}), 404
+        return json_response({'status': 'error', 'message': 'Image not found'}, 404)
 
 
 @weather_sat_bp.route('/images', methods=['DELETE'])
@@ -417,7 +467,7 @@ def delete_all_images():
     """
     decoder = get_weather_sat_decoder()
     count = decoder.delete_all_images()
-    return jsonify({'status': 'ok', 'deleted': count})
+    return json_response({'status': 'ok', 'deleted': count})
 
 
 @weather_sat_bp.route('/stream')
@@ -427,13 +477,60 @@ def stream_progress():
     Returns:
         SSE stream (text/event-stream)
     """
-    response = Response(sse_stream(_weather_sat_queue), mimetype='text/event-stream')
+    def generate():
+        events: deque = deque(maxlen=SSE_SUBSCRIBER_MAXLEN)
+        wakeup = threading.Event()
+        subscriber = (events, wakeup)
+        with _subscribers_lock:
+            _subscribers.append(subscriber)
+        try:
+            while True:
+                if not wakeup.wait(timeout=SSE_KEEPALIVE_INTERVAL):
+                    yield _KEEPALIVE_SSE
+                    continue
+                wakeup.clear()
+                while events:
+                    yield events.popleft()
+        finally:
+            with _subscribers_lock:
+                _subscribers.remove(subscriber)
+
+    response = Response(generate(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache'
     response.headers['X-Accel-Buffering'] = 'no'
     response.headers['Connection'] = 'keep-alive'
     return response
 
 
+# Encoded /passes bodies keyed by query; predictions barely move within a
+# minute, so UI refreshes are answered without re-running skyfield
+PASSES_CACHE_TTL = 60.0
+_PASSES_CACHE_MAX = 64
+_passes_cache: dict[tuple, tuple[float, bytes]] = {}
+_passes_cache_lock = threading.Lock()
+
+
+def _get_cached_passes(key: tuple) -> bytes | None:
+    """Return a cached /passes body if it is still fresh."""
+    with _passes_cache_lock:
+        entry = _passes_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= PASSES_CACHE_TTL:
+        return None
+    return entry[1]
+
+
+def _store_cached_passes(key: tuple, body: bytes) -> None:
+    """Cache a /passes body, evicting expired and then oldest entries."""
+    now = time.monotonic()
+    with _passes_cache_lock:
+        if len(_passes_cache) >= _PASSES_CACHE_MAX:
+            for stale in [k for k, (stored, _) in _passes_cache.items() if now - stored >= PASSES_CACHE_TTL]:
+                del _passes_cache[stale]
+        while len(_passes_cache) >= _PASSES_CACHE_MAX:
+            del _passes_cache[next(iter(_passes_cache))]
+        _passes_cache[key] = (now, body)
+
+
 @weather_sat_bp.route('/passes')
 def get_passes():
     """Get upcoming weather satellite passes for observer location.
@@ -456,24 +553,33 @@ def get_passes():
     raw_lon = request.args.get('longitude')
 
     if raw_lat is None or raw_lon is None:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'latitude and longitude parameters required'
-        }), 400
+        }, 400)
 
     try:
         lat = validate_latitude(raw_lat)
         lon = validate_longitude(raw_lon)
     except ValueError as e:
         logger.warning('Invalid coordinates in get_passes: %s', e)
-        return jsonify({'status': 'error', 'message': 'Invalid coordinates'}), 400
+        return json_response({'status': 'error', 'message': 'Invalid coordinates'}, 400)
 
     hours = max(1, min(request.args.get('hours', 24, type=int), 72))
     min_elevation = max(0, min(request.args.get('min_elevation', 15, type=float), 90))
 
-    try:
-        from utils.weather_sat_predict import predict_passes
+    if not SKYFIELD_AVAILABLE:
+        return json_response({
+            'status': 'error',
+            'message': 'skyfield library not installed'
+        }, 503)
 
+    key = (lat, lon, hours, min_elevation, include_trajectory, include_ground_track)
+    cached = _get_cached_passes(key)
+    if cached is not None:
+        return json_response(cached)
+
+    try:
         all_passes = predict_passes(
             lat=lat,
             lon=lon,
@@ -483,7 +589,7 @@ def get_passes():
             include_ground_track=include_ground_track,
         )
 
-        return jsonify({
+        body = dumps_json({
             'status': 'ok',
             'passes': all_passes,
             'count': len(all_passes),
@@ -491,19 +597,21 @@ def get_passes():
             'prediction_hours': hours,
             'min_elevation': min_elevation,
         })
+        _store_cached_passes(key, body)
+        return json_response(body)
 
     except ImportError:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'skyfield library not installed'
-        }), 503
+        }, 503)
 
     except Exception as e:
         logger.error(f"Error predicting passes: {e}")
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Pass prediction failed'
-        }), 500
+        }, 500)
 
 
 # ========================
@@ -513,14 +621,7 @@ def get_passes():
 
 def _scheduler_event_callback(event: dict) -> None:
     """Forward scheduler events to the SSE queue."""
-    try:
-        _weather_sat_queue.put_nowait(event)
-    except queue.Full:
-        try:
-            _weather_sat_queue.get_nowait()
-            _weather_sat_queue.put_nowait(event)
-        except queue.Empty:
-            pass
+    _publish(event)
 
 
 @weather_sat_bp.route('/schedule/enable', methods=['POST'])
@@ -545,10 +646,10 @@ def enable_schedule():
     data = request.get_json(silent=True) or {}
 
     if data.get('latitude') is None or data.get('longitude') is None:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'latitude and longitude required'
-        }), 400
+        }, 400)
 
     try:
         lat = validate_latitude(data.get('latitude'))
@@ -558,10 +659,10 @@ def enable_schedule():
         gain_val = validate_gain(data.get('gain', 40.0))
     except ValueError as e:
         logger.warning('Invalid parameter in enable_schedule: %s', e)
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': 'Invalid parameter value'
-        }), 400
+        }, 400)
 
     scheduler = get_weather_sat_scheduler()
     scheduler.set_callbacks(_progress_callback, _scheduler_event_callback)
@@ -575,7 +676,7 @@ def enable_schedule():
         bias_t=bool(data.get('bias_t', False)),
     )
 
-    return jsonify({'status': 'ok', **result})
+    return json_response({'status': 'ok', **result})
 
 
 @weather_sat_bp.route('/schedule/disable', methods=['POST'])
@@ -585,7 +686,7 @@ def disable_schedule():
 
     scheduler = get_weather_sat_scheduler()
     result = scheduler.disable()
-    return jsonify(result)
+    return json_response(result)
 
 
 @weather_sat_bp.route('/schedule/status')
@@ -594,7 +695,7 @@ def schedule_status():
     from utils.weather_sat_scheduler import get_weather_sat_scheduler
 
     scheduler = get_weather_sat_scheduler()
-    return jsonify(scheduler.get_status())
+    return json_response(scheduler.get_status())
 
 
 @weather_sat_bp.route('/schedule/passes')
@@ -604,7 +705,7 @@ def schedule_passes():
 
     scheduler = get_weather_sat_scheduler()
     passes = scheduler.get_passes()
-    return jsonify({
+    return json_response({
         'status': 'ok',
         'passes': passes,
         'count': len(passes),
@@ -617,10 +718,10 @@ def skip_pass(pass_id: str):
     from utils.weather_sat_scheduler import get_weather_sat_scheduler
 
     if not pass_id.replace('_', '').replace('-', '').isalnum():
-        return jsonify({'status': 'error', 'message': 'Invalid pass ID'}), 400
+        return json_response({'status': 'error', 'message': 'Invalid pass ID'}, 400)
 
     scheduler = get_weather_sat_scheduler()
     if scheduler.skip_pass(pass_id):
-        return jsonify({'status': 'skipped', 'pass_id': pass_id})
+        return json_response({'status': 'skipped', 'pass_id': pass_id})
     else:
-        return jsonify({'status': 'error', 'message': 'Pass not found or already processed'}), 404
+        return json_response({'status': 'error', 'message': 'Pass not found or already processed'}, 404)
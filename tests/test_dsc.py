@@ -435,6 +435,27 @@ class TestDSCConstants:
         assert 109 in DISTRESS_NATURE_CODES  # PIRACY
         assert 110 in DISTRESS_NATURE_CODES  # MOB
 
+    def test_code_tables_match_code_maps(self):
+        """Test that the offset tables agree with the code maps."""
+        from utils.dsc.constants import (
+            DISTRESS_NATURE_CODES,
+            DISTRESS_NATURE_TABLE,
+            FORMAT_CODES,
+            FORMAT_TABLE,
+            TELECOMMAND_CODES,
+            TELECOMMAND_TABLE,
+            lookup_code,
+        )
+
+        for codes, table in (
+            (FORMAT_CODES, FORMAT_TABLE),
+            (DISTRESS_NATURE_CODES, DISTRESS_NATURE_TABLE),
+            (TELECOMMAND_CODES, TELECOMMAND_TABLE),
+        ):
+            for code in range(-1, 260):
+                assert lookup_code(table, code) == codes.get(code)
+            assert lookup_code(table, None) is None
+
     def test_mid_country_map_completeness(self):
         """Test that common MID codes are defined."""
         from utils.dsc.constants import MID_COUNTRY_MAP
@@ -8,10 +8,35 @@ Tests cover:
 - Graceful degradation when SDK not installed
 """
 
+import base64
+import hashlib
 import json
+import threading
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from datetime import datetime, timezone
+from functools import lru_cache
+
+from flask import Flask
+
+from routes import meshtastic as mesh_routes
+from routes.meshtastic import (
+    _MeshBuffer,
+    _cached_channels,
+    _cached_node,
+    _invalidate_device_cache,
+    _serialized_channels,
+    meshtastic_bp,
+)
+from utils.sse import format_sse
+from utils.meshtastic import (
+    ChannelConfig,
+    MeshtasticClient,
+    MeshtasticMessage,
+    is_meshtastic_available,
+)
 
 
 # =============================================================================
@@ -23,7 +48,6 @@ class TestMeshtasticAvailability:
 
     def test_is_meshtastic_available_returns_bool(self):
         """is_meshtastic_available should return a boolean."""
-        from utils.meshtastic import is_meshtastic_available
         result = is_meshtastic_available()
         assert isinstance(result, bool)
 
@@ -33,8 +57,6 @@ class TestMeshtasticMessage:
 
     def test_message_to_dict(self):
         """MeshtasticMessage should convert to dictionary."""
-        from utils.meshtastic import MeshtasticMessage
-
         msg = MeshtasticMessage(
             from_id='!a1b2c3d4',
             to_id='^all',
@@ -62,8 +84,6 @@ class TestMeshtasticMessage:
 
     def test_message_with_none_values(self):
         """MeshtasticMessage should handle None values."""
-        from utils.meshtastic import MeshtasticMessage
-
         msg = MeshtasticMessage(
             from_id='!00000001',
             to_id='!00000002',
@@ -88,8 +108,6 @@ class TestChannelConfig:
 
     def test_channel_to_dict_hides_psk(self):
         """ChannelConfig.to_dict should not expose raw PSK."""
-        from utils.meshtastic import ChannelConfig
-
         config = ChannelConfig(
             index=0,
             name='Primary',
@@ -108,8 +126,6 @@ class TestChannelConfig:
 
     def test_channel_default_key_detection(self):
         """ChannelConfig should detect default key."""
-        from utils.meshtastic import ChannelConfig
-
         # Default key is single byte 0x01
         config = ChannelConfig(index=0, name='Test', psk=b'\x01', role=1)
         d = config.to_dict()
@@ -119,8 +135,6 @@ class TestChannelConfig:
 
     def test_channel_aes128_detection(self):
         """ChannelConfig should detect AES-128 key."""
-        from utils.meshtastic import ChannelConfig
-
         config = ChannelConfig(index=0, name='Test', psk=b'0' * 16, role=1)
         d = config.to_dict()
 
@@ -129,8 +143,6 @@ class TestChannelConfig:
 
     def test_channel_no_encryption(self):
         """ChannelConfig should detect no encryption."""
-        from utils.meshtastic import ChannelConfig
-
         config = ChannelConfig(index=0, name='Test', psk=b'', role=1)
         d = config.to_dict()
 
@@ -143,8 +155,6 @@ class TestPSKParsing:
 
     def test_parse_psk_none(self):
         """Should parse 'none' as empty bytes."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
         result = client._parse_psk('none')
 
@@ -152,8 +162,6 @@ class TestPSKParsing:
 
     def test_parse_psk_default(self):
         """Should parse 'default' as single byte."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
         result = client._parse_psk('default')
 
@@ -161,8 +169,6 @@ class TestPSKParsing:
 
     def test_parse_psk_random(self):
         """Should generate 32 random bytes for 'random'."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
         result = client._parse_psk('random')
 
@@ -173,9 +179,6 @@ class TestPSKParsing:
 
     def test_parse_psk_base64(self):
         """Should decode base64 PSK."""
-        from utils.meshtastic import MeshtasticClient
-        import base64
-
         client = MeshtasticClient()
         # 32-byte key encoded as base64
         key = b'A' * 32
@@ -187,8 +190,6 @@ class TestPSKParsing:
 
     def test_parse_psk_hex(self):
         """Should decode hex PSK."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
         # 16-byte key as hex
         result = client._parse_psk('0x' + '41' * 16)
@@ -197,9 +198,6 @@ class TestPSKParsing:
 
     def test_parse_psk_simple_passphrase(self):
         """Should hash simple passphrase to 32-byte key."""
-        from utils.meshtastic import MeshtasticClient
-        import hashlib
-
         client = MeshtasticClient()
         result = client._parse_psk('simple:MySecretPassword')
 
@@ -209,8 +207,6 @@ class TestPSKParsing:
 
     def test_parse_psk_invalid(self):
         """Should return None for invalid PSK format."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
 
         assert client._parse_psk('base64:!!!invalid!!!') is None
@@ -218,9 +214,6 @@ class TestPSKParsing:
 
     def test_parse_psk_raw_base64(self):
         """Should accept raw base64 without prefix."""
-        from utils.meshtastic import MeshtasticClient
-        import base64
-
         client = MeshtasticClient()
         key = b'B' * 16
         encoded = base64.b64encode(key).decode()
@@ -235,179 +228,352 @@ class TestNodeIdFormatting:
 
     def test_format_regular_node(self):
         """Should format regular node as hex."""
-        from utils.meshtastic import MeshtasticClient
-
         result = MeshtasticClient._format_node_id(0xDEADBEEF)
 
         assert result == '!deadbeef'
 
     def test_format_broadcast(self):
         """Should format broadcast address."""
-        from utils.meshtastic import MeshtasticClient
-
         result = MeshtasticClient._format_node_id(0xFFFFFFFF)
 
         assert result == '^all'
 
 
+def _make_message(text, channel=0):
+    """Build a MeshtasticMessage for route-level tests."""
+    return MeshtasticMessage(
+        from_id='!a1b2c3d4',
+        to_id='^all',
+        message=text,
+        portnum='TEXT_MESSAGE_APP',
+        channel=channel,
+        rssi=-95,
+        snr=-3.5,
+        hop_limit=3,
+        timestamp=datetime(2026, 1, 27, 12, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+def _make_buffer(messages):
+    """Build a message buffer filled with (text, channel) pairs."""
+    buf = _MeshBuffer()
+    for text, channel in messages:
+        buf.on_msg(_make_message(text, channel))
+    return buf
+
+
+# (text, channel) specs shared by the /messages route tests
+_TEN_MESSAGES = tuple((f'msg {i}', 0) for i in range(10))
+_CHANNEL_MESSAGES = (('msg 1', 0), ('msg 2', 1), ('msg 3', 0))
+
+
+@pytest.fixture(scope='module')
+def ten_message_buffer():
+    """Buffer of ten channel-0 messages; the route only reads it."""
+    return _make_buffer(_TEN_MESSAGES)
+
+
+@pytest.fixture(scope='module')
+def channel_message_buffer():
+    """Buffer with messages on channels 0 and 1; the route only reads it."""
+    return _make_buffer(_CHANNEL_MESSAGES)
+
+
+class TestMessageCallback:
+    """Tests for the route-level message callback."""
+
+    def test_callback_queues_serialized_sse(self):
+        """on_msg should store a record in history and SSE bytes per stream."""
+        msg = _make_message('hello', channel=0)
+        buf = _MeshBuffer(backlog=4, max_history=10)
+        queue, wakeup = buf.subscribe()
+
+        buf.on_msg(msg)
+
+        assert wakeup.is_set()
+        assert list(buf.hist) == [msg.to_dict()]
+        assert list(buf.hist_by_ch[0]) == list(buf.hist)
+        payload = queue.popleft()
+        assert isinstance(payload, bytes)
+        assert payload.startswith(b'data: ')
+        assert json.loads(payload[len(b'data: '):]) == msg.to_dict()
+
+    def test_full_backlog_drops_oldest(self):
+        """A stream that falls behind should keep the newest messages."""
+        buf = _MeshBuffer(backlog=2, max_history=10)
+        queue, _ = buf.subscribe()
+
+        for text in ('a', 'b', 'c'):
+            buf.on_msg(_make_message(text))
+
+        assert [json.loads(p[len(b'data: '):])['message'] for p in queue] == ['b', 'c']
+
+    def test_unsubscribed_stream_not_queued(self):
+        """Messages should not accumulate for a disconnected stream."""
+        buf = _MeshBuffer(backlog=4, max_history=10)
+        queue, wakeup = buf.subscribe()
+        buf.unsubscribe(wakeup)
+
+        buf.on_msg(_make_message('hello'))
+
+        assert not queue
+        assert buf.streams == {}
+
+    def test_clear_drops_history_and_queue(self):
+        """clear() should empty stream backlogs and both history views."""
+        buf = _MeshBuffer(backlog=4, max_history=10)
+        queue, _ = buf.subscribe()
+        buf.on_msg(_make_message('hello', channel=2))
+        buf.clear()
+
+        assert not queue
+        assert len(buf.hist) == 0
+        assert len(buf.hist_by_ch[2]) == 0
+
+    def test_channel_history_shares_entries(self):
+        """Both history views should hold the same dict for a message."""
+        buf = _MeshBuffer(backlog=4, max_history=10)
+        buf.on_msg(_make_message('hello', channel=3))
+
+        assert buf.hist_by_ch[3][0] is buf.hist[0]
+
+
+class TestDeviceCache:
+    """Tests for the short-lived node/channel cache."""
+
+    def test_node_info_cached_until_invalidated(self):
+        """Repeated lookups within the TTL should reach the device once."""
+        client = Mock()
+        client.get_node_info.return_value = 'node'
+        _invalidate_device_cache()
+
+        assert _cached_node(client, ttl=60) == 'node'
+        assert _cached_node(client, ttl=60) == 'node'
+        assert client.get_node_info.call_count == 1
+
+        _invalidate_device_cache()
+        _cached_node(client, ttl=60)
+        assert client.get_node_info.call_count == 2
+
+    def test_cache_not_shared_between_clients(self):
+        """A different client should not be served another client's data."""
+        first, second = Mock(), Mock()
+        first.get_channels.return_value = ['a']
+        second.get_channels.return_value = ['b']
+        _invalidate_device_cache()
+
+        assert _cached_channels(first, ttl=60) == ['a']
+        assert _cached_channels(second, ttl=60) == ['b']
+
+    def test_serialized_channels_reused_until_invalidated(self):
+        """Channel dicts should be built once per invalidation."""
+        channel = Mock()
+        channel.to_dict.return_value = {'index': 0}
+        client = Mock()
+        client.get_channels.return_value = [channel]
+        _invalidate_device_cache()
+
+        assert _serialized_channels(client) == [{'index': 0}]
+        assert _serialized_channels(client) == [{'index': 0}]
+        assert channel.to_dict.call_count == 1
+
+        _invalidate_device_cache()
+        _serialized_channels(client)
+        assert channel.to_dict.call_count == 2
+
+
 # =============================================================================
 # Route Tests (Mocked)
 # =============================================================================
 
-class TestMeshtasticRoutes:
-    """Tests for Flask route endpoints."""
+@lru_cache(maxsize=None)
+def _build_app(config_key):
+    """Build a Meshtastic-only Flask app once per frozenset of config items."""
+    app = Flask(__name__)
+    app.config.update(dict(config_key))
+    app.register_blueprint(meshtastic_bp)
 
-    @pytest.fixture
-    def app(self):
-        """Create Flask test app."""
-        from flask import Flask
-        from routes.meshtastic import meshtastic_bp
+    return app
 
-        app = Flask(__name__)
-        app.config['TESTING'] = True
-        app.register_blueprint(meshtastic_bp)
 
-        return app
+@pytest.fixture(scope='session')
+def app():
+    """Create Flask test app once; route tests only read from it."""
+    return _build_app(frozenset({'TESTING': True}.items()))
 
-    @pytest.fixture
-    def client(self, app):
-        """Create test client."""
-        return app.test_client()
 
-    def test_status_sdk_not_installed(self, client):
-        """GET /meshtastic/status should report SDK unavailable."""
-        with patch('routes.meshtastic.is_meshtastic_available', return_value=False):
-            response = client.get('/meshtastic/status')
-            data = json.loads(response.data)
+@pytest.fixture(scope='class')
+def client(app):
+    """Create one test client per class; route tests keep no cookies or session."""
+    return app.test_client()
 
-            assert response.status_code == 200
-            assert data['available'] is False
-            assert 'not installed' in data['error']
 
-    def test_status_not_connected(self, client):
-        """GET /meshtastic/status should report not running when disconnected."""
-        with patch('routes.meshtastic.is_meshtastic_available', return_value=True):
-            with patch('routes.meshtastic.get_meshtastic_client', return_value=None):
-                response = client.get('/meshtastic/status')
-                data = json.loads(response.data)
+class TestMeshtasticRoutes:
+    """Tests for Flask route endpoints."""
 
-                assert response.status_code == 200
-                assert data['available'] is True
-                assert data['running'] is False
+    @pytest.fixture
+    def mesh(self):
+        """Patch the route module's SDK flag and client accessors in one go.
+
+        Defaults to SDK available and no connected client; tests adjust the
+        returned mocks or the module flag, which is restored on exit.
+        """
+        with patch.multiple(
+            'routes.meshtastic',
+            _MESH_AVAILABLE=True,
+            get_meshtastic_client=DEFAULT,
+            stop_meshtastic=DEFAULT,
+        ) as mocks:
+            mocks['get_meshtastic_client'].return_value = None
+            yield mocks
+
+    def test_status_sdk_not_installed(self, client, mesh):
+        """GET /meshtastic/status should report SDK unavailable."""
+        mesh_routes._MESH_AVAILABLE = False
 
-    def test_start_sdk_not_installed(self, client):
-        """POST /meshtastic/start should fail if SDK not installed."""
-        with patch('routes.meshtastic.is_meshtastic_available', return_value=False):
-            response = client.post('/meshtastic/start')
-            data = json.loads(response.data)
+        response = client.get('/meshtastic/status')
+        data = response.get_json()
 
-            assert response.status_code == 400
-            assert data['status'] == 'error'
+        assert response.status_code == 200
+        assert data['available'] is False
+        assert 'not installed' in data['error']
 
-    def test_stop_always_succeeds(self, client):
+    def test_status_not_connected(self, client, mesh):
+        """GET /meshtastic/status should report not running when disconnected."""
+        response = client.get('/meshtastic/status')
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data['available'] is True
+        assert data['running'] is False
+
+    @pytest.mark.parametrize('method, path, available, status, message', [
+        ('post', '/meshtastic/start', False, 400, b'not installed'),
+        ('get', '/meshtastic/channels', True, 400, b'Not connected'),
+        ('get', '/meshtastic/node', True, 400, b'Not connected'),
+        ('post', '/meshtastic/send', True, 400, b'Not connected'),
+        ('post', '/meshtastic/traceroute', True, 400, b'Not connected'),
+        ('post', '/meshtastic/position/request', True, 400, b'Not connected'),
+    ])
+    def test_error_paths(self, client, mesh, method, path, available, status, message):
+        """Endpoints should fail cleanly without the SDK or a connected device."""
+        mesh_routes._MESH_AVAILABLE = available
+
+        response = getattr(client, method)(path, json={})
+        data = response.get_json()
+
+        assert response.status_code == status
+        assert data['status'] == 'error'
+        assert message in response.data
+
+    def test_stop_always_succeeds(self, client, mesh):
         """POST /meshtastic/stop should always succeed."""
-        with patch('routes.meshtastic.stop_meshtastic'):
-            response = client.post('/meshtastic/stop')
-            data = json.loads(response.data)
-
-            assert response.status_code == 200
-            assert data['status'] == 'stopped'
-
-    def test_channels_not_connected(self, client):
-        """GET /meshtastic/channels should fail if not connected."""
-        with patch('routes.meshtastic.get_meshtastic_client', return_value=None):
-            response = client.get('/meshtastic/channels')
-            data = json.loads(response.data)
+        response = client.post('/meshtastic/stop')
+        data = response.get_json()
 
-            assert response.status_code == 400
-            assert 'Not connected' in data['message']
+        assert response.status_code == 200
+        assert data['status'] == 'stopped'
+        mesh['stop_meshtastic'].assert_called_once()
 
-    def test_configure_channel_invalid_index(self, client):
+    def test_configure_channel_invalid_index(self, client, mesh):
         """POST /meshtastic/channels/<id> should reject invalid index."""
-        mock_client = Mock()
-        mock_client.is_running = True
+        mesh['get_meshtastic_client'].return_value = SimpleNamespace(is_running=True)
 
-        with patch('routes.meshtastic.get_meshtastic_client', return_value=mock_client):
-            response = client.post(
-                '/meshtastic/channels/10',
-                json={'name': 'Test'},
-                content_type='application/json'
-            )
-            data = json.loads(response.data)
+        response = client.post('/meshtastic/channels/10', json={'name': 'Test'})
 
-            assert response.status_code == 400
-            assert 'must be 0-7' in data['message']
+        assert response.status_code == 400
+        assert b'must be 0-7' in response.data
 
-    def test_configure_channel_no_params(self, client):
+    def test_configure_channel_no_params(self, client, mesh):
         """POST /meshtastic/channels/<id> should require name or psk."""
-        mock_client = Mock()
-        mock_client.is_running = True
+        mesh['get_meshtastic_client'].return_value = SimpleNamespace(is_running=True)
 
-        with patch('routes.meshtastic.get_meshtastic_client', return_value=mock_client):
-            response = client.post(
-                '/meshtastic/channels/0',
-                json={},
-                content_type='application/json'
-            )
-            data = json.loads(response.data)
+        response = client.post('/meshtastic/channels/0', json={})
 
-            assert response.status_code == 400
-            assert 'Must provide' in data['message']
+        assert response.status_code == 400
+        assert b'Must provide' in response.data
 
     def test_messages_empty(self, client):
         """GET /meshtastic/messages should return empty list initially."""
-        with patch('routes.meshtastic._recent_messages', []):
+        with patch('routes.meshtastic._buf', _make_buffer([])):
             response = client.get('/meshtastic/messages')
-            data = json.loads(response.data)
+            data = response.get_json()
 
             assert response.status_code == 200
             assert data['status'] == 'ok'
             assert data['messages'] == []
             assert data['count'] == 0
 
-    def test_messages_with_limit(self, client):
+    def test_messages_with_limit(self, client, ten_message_buffer):
         """GET /meshtastic/messages should respect limit param."""
-        test_messages = [{'id': i} for i in range(10)]
-
-        with patch('routes.meshtastic._recent_messages', test_messages):
+        with patch('routes.meshtastic._buf', ten_message_buffer):
             response = client.get('/meshtastic/messages?limit=3')
-            data = json.loads(response.data)
+            data = response.get_json()
 
             assert response.status_code == 200
             assert len(data['messages']) == 3
             # Should return last 3 (most recent)
-            assert data['messages'][0]['id'] == 7
+            assert data['messages'][0]['message'] == 'msg 7'
 
-    def test_messages_filter_by_channel(self, client):
+    def test_messages_filter_by_channel(self, client, channel_message_buffer):
         """GET /meshtastic/messages should filter by channel."""
-        test_messages = [
-            {'id': 1, 'channel': 0},
-            {'id': 2, 'channel': 1},
-            {'id': 3, 'channel': 0},
-        ]
-
-        with patch('routes.meshtastic._recent_messages', test_messages):
+        with patch('routes.meshtastic._buf', channel_message_buffer):
             response = client.get('/meshtastic/messages?channel=0')
-            data = json.loads(response.data)
+            data = response.get_json()
 
             assert response.status_code == 200
             assert len(data['messages']) == 2
             assert all(m['channel'] == 0 for m in data['messages'])
 
     def test_stream_endpoint_exists(self, client):
-        """GET /meshtastic/stream should return SSE content type."""
-        response = client.get('/meshtastic/stream')
+        """HEAD /meshtastic/stream should return SSE content type."""
+        # HEAD keeps Werkzeug from starting the generator, which would
+        # otherwise block until the first keepalive
+        response = client.head('/meshtastic/stream')
 
+        assert response.status_code == 200
         assert response.content_type == 'text/event-stream'
-
-    def test_node_not_connected(self, client):
-        """GET /meshtastic/node should fail if not connected."""
-        with patch('routes.meshtastic.get_meshtastic_client', return_value=None):
-            response = client.get('/meshtastic/node')
-            data = json.loads(response.data)
-
-            assert response.status_code == 400
-            assert 'Not connected' in data['message']
+        assert response.data == b''
+
+    def test_concurrent_streams_each_receive_all_messages(self, app):
+        """Every open stream should get every message exactly once, in order."""
+        buf = _MeshBuffer(max_history=10)
+        messages = [_make_message(f'msg {i}') for i in range(100)]
+        expected = b''.join(format_sse(m.to_dict()).encode('utf-8') for m in messages)
+        received = [bytearray(), bytearray()]
+
+        # Called directly: the test client would block on the first chunk
+        with patch('routes.meshtastic._buf', buf), app.test_request_context():
+            responses = [mesh_routes.stream_messages() for _ in received]
+
+            def consume(response, out):
+                # Closed here: a generator cannot be closed from another
+                # thread while it is running
+                try:
+                    chunks = iter(response.response)
+                    while len(out) < len(expected):
+                        out += next(chunks)
+                finally:
+                    response.close()
+
+            threads = [
+                threading.Thread(target=consume, args=(response, out), daemon=True)
+                for response, out in zip(responses, received)
+            ]
+            for thread in threads:
+                thread.start()
+            deadline = time.monotonic() + 5
+            while len(buf.streams) < len(threads) and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            for msg in messages:
+                buf.on_msg(msg)
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert received == [expected, expected]
+        assert buf.streams == {}
 
 
 # =============================================================================
@@ -419,8 +585,6 @@ class TestMeshtasticClientMocked:
 
     def test_client_init(self):
         """MeshtasticClient should initialize with default state."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
 
         assert client.is_running is False
@@ -429,8 +593,6 @@ class TestMeshtasticClientMocked:
 
     def test_client_connect_no_sdk(self):
         """MeshtasticClient.connect should fail gracefully without SDK."""
-        from utils.meshtastic import MeshtasticClient
-
         with patch('utils.meshtastic.HAS_MESHTASTIC', False):
             client = MeshtasticClient()
             result = client.connect()
@@ -440,8 +602,6 @@ class TestMeshtasticClientMocked:
 
     def test_client_disconnect_idempotent(self):
         """MeshtasticClient.disconnect should be safe to call multiple times."""
-        from utils.meshtastic import MeshtasticClient
-
         client = MeshtasticClient()
 
         # Should not raise even when not connected
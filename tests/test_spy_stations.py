@@ -0,0 +1,153 @@
+"""Tests for the spy stations routes."""
+
+import gzip
+import json
+
+import pytest
+from flask import Flask
+
+from routes.spy_stations import STATIONS, _filtered_payload, spy_stations_bp
+
+
+@pytest.fixture
+def client():
+    """Create test client with only the spy stations blueprint."""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.register_blueprint(spy_stations_bp)
+    return app.test_client()
+
+
+def _ids(response):
+    return [s['id'] for s in response.get_json()['stations']]
+
+
+def test_stations_unfiltered(client):
+    """GET /stations should return every station in source order."""
+    response = client.get('/spy-stations/stations')
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert data['status'] == 'success'
+    assert data['count'] == len(STATIONS)
+    assert _ids(response) == [s['id'] for s in STATIONS]
+
+
+@pytest.mark.parametrize('query, predicate', [
+    ('type=number', lambda s: s['type'] == 'number'),
+    ('type=diplomatic', lambda s: s['type'] == 'diplomatic'),
+    ('country=ru', lambda s: s['country_code'] == 'RU'),
+    ('mode=usb', lambda s: 'usb' in s['mode'].lower()),
+    ('type=number&country=RU&mode=usb',
+     lambda s: s['type'] == 'number' and s['country_code'] == 'RU' and 'usb' in s['mode'].lower()),
+])
+def test_stations_filters_match_linear_scan(client, query, predicate):
+    """Filtered results should match a plain scan over STATIONS, in order."""
+    response = client.get(f'/spy-stations/stations?{query}')
+    expected = [s['id'] for s in STATIONS if predicate(s)]
+
+    assert expected
+    assert _ids(response) == expected
+    assert response.get_json()['count'] == len(expected)
+
+
+def test_stations_unknown_filter_value(client):
+    """Unknown filter values should return an empty list."""
+    response = client.get('/spy-stations/stations?type=nope')
+    data = response.get_json()
+
+    assert data['count'] == 0
+    assert data['stations'] == []
+
+
+def test_unknown_filter_values_share_cache_entry(client):
+    """Junk filter values should not each get their own cached body."""
+    _filtered_payload.cache_clear()
+
+    for query in ('type=nope', 'type=junk', 'country=XX', 'mode=zzz', 'type=number&mode=zzz'):
+        assert client.get(f'/spy-stations/stations?{query}').get_json()['count'] == 0
+
+    assert _filtered_payload.cache_info().currsize == 1
+
+
+def test_ad_hoc_filters_not_precompressed(client):
+    """Only the pinned filter bodies should be served gzipped."""
+    response = client.get(
+        '/spy-stations/stations?type=number&mode=usb',
+        headers={'Accept-Encoding': 'gzip'},
+    )
+
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_station_by_id(client):
+    """GET /stations/<id> should return the matching station."""
+    response = client.get('/spy-stations/stations/e06')
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert data['station']['name'] == 'E06'
+
+
+def test_station_not_found(client):
+    """GET /stations/<id> should 404 for unknown IDs."""
+    response = client.get('/spy-stations/stations/nonexistent')
+
+    assert response.status_code == 404
+    assert response.get_json()['status'] == 'error'
+
+
+def test_filters(client):
+    """GET /filters should list types, countries and modes."""
+    response = client.get('/spy-stations/filters')
+    filters = response.get_json()['filters']
+
+    assert set(filters['types']) == {s['type'] for s in STATIONS}
+    assert {c['code'] for c in filters['countries']} == {s['country_code'] for s in STATIONS}
+    assert filters['modes'] == sorted({s['mode'].split('/')[0] for s in STATIONS})
+
+
+@pytest.mark.parametrize('path', [
+    '/spy-stations/stations',
+    '/spy-stations/stations?type=number&mode=usb',
+    '/spy-stations/stations/e06',
+    '/spy-stations/filters',
+])
+def test_etag_not_modified(client, path):
+    """Responses should carry an ETag and honour If-None-Match."""
+    first = client.get(path)
+    etag = first.headers['ETag']
+
+    second = client.get(path, headers={'If-None-Match': etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.data == b''
+
+
+def test_stations_gzip_when_accepted(client):
+    """The unfiltered list should be served precompressed to gzip clients."""
+    plain = client.get('/spy-stations/stations')
+    compressed = client.get('/spy-stations/stations', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert compressed.headers['ETag'] != plain.headers['ETag']
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+
+
+@pytest.mark.parametrize('path, headers', [
+    ('/spy-stations/stations', {}),
+    ('/spy-stations/stations', {'Accept-Encoding': 'gzip'}),
+    ('/spy-stations/stations?mode=usb', {}),
+    ('/spy-stations/stations/nope', {}),
+    ('/spy-stations/filters', {}),
+])
+def test_content_length_set(client, path, headers):
+    """Pre-encoded bodies should be sent with an exact Content-Length."""
+    response = client.get(path, headers=headers)
+
+    assert response.headers['Content-Type'] == 'application/json'
+    assert int(response.headers['Content-Length']) == len(response.data)
@@ -7,81 +7,110 @@ and ground track generation.
 from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
+import numpy as np
 import pytest
 
 from utils.weather_sat_predict import predict_passes
 
 
-class TestPredictPasses:
-    """Tests for predict_passes() function."""
+_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    def test_predict_passes_no_tle_data(self, mock_tle, mock_load):
-        """predict_passes() should handle missing TLE data."""
-        mock_tle.get.return_value = None
-        mock_ts = MagicMock()
-        mock_ts.now.return_value = MagicMock()
-        mock_ts.utc.return_value = MagicMock()
-        mock_load.timescale.return_value = mock_ts
+_NOAA_18_TLE = (
+    'NOAA-18',
+    '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
+    '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
+)
 
-        passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
-        assert passes == []
+def _mock_time(dt):
+    """Helper to create a mock skyfield time at a UTC datetime."""
+    mock_t = MagicMock()
+    if not isinstance(dt, datetime):
+        dt = datetime.now(timezone.utc)
+    mock_t.utc_datetime.return_value = dt
+    mock_t.tt = 2440587.5 + dt.timestamp() / 86400
+    return mock_t
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_basic(self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load):
-        """predict_passes() should predict basic passes."""
-        # Mock timescale
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        # Mock TLE data
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
 
-        # Mock observer
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
+def _pass_times(start_hours):
+    """Build (rise, set) mock times for a 15 minute pass."""
+    rise = _mock_time(_NOW + timedelta(hours=start_hours))
+    set_ = _mock_time(_NOW + timedelta(hours=start_hours, minutes=15))
+    return rise, set_
+
 
-        # Mock satellite
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
+@pytest.fixture
+def predict_mocks():
+    """Patch skyfield and TLE sources around predict_passes().
 
-        # Mock pass detection - one pass
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
+    Only NOAA-18 is active, with a fixed TLE and no live TLE cache. Set
+    crossings.return_value to (times, rising) and call set_elevation() to
+    choose the altitude reported at every sample of a pass.
+    """
+    from utils.weather_sat import WEATHER_SATELLITES
 
-        mock_find.return_value = ([rise_time, set_time], [True, False])
+    mock_ts = MagicMock()
+    mock_ts.now.return_value = _mock_time(_NOW)
+    mock_ts.utc.side_effect = _mock_time
+    mock_ts.tt_jd.side_effect = lambda jd: np.asarray(jd)
 
-        # Mock topocentric calculations
+    mock_satellite = MagicMock()
+    mock_diff = MagicMock()
+    mock_satellite.__sub__.return_value = mock_diff
+
+    def set_elevation(degrees):
         def mock_topocentric(t):
             topo = MagicMock()
             alt = MagicMock()
-            alt.degrees = 45.0
+            alt.degrees = np.full(np.shape(t), degrees)
             az = MagicMock()
-            az.degrees = 180.0
+            az.degrees = np.full(np.shape(t), 180.0)
             topo.altaz.return_value = (alt, az, MagicMock())
             return topo
-
-        mock_diff = MagicMock()
         mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+
+    mock_tle = MagicMock()
+    mock_tle.get.return_value = _NOAA_18_TLE
+    satellites = {'NOAA-18': {**WEATHER_SATELLITES['NOAA-18'], 'active': True}}
+
+    with patch('utils.weather_sat_predict._get_timescale', return_value=mock_ts), \
+         patch('utils.weather_sat_predict.TLE_SATELLITES', mock_tle), \
+         patch('utils.weather_sat_predict.WEATHER_SATELLITES', satellites), \
+         patch('routes.satellite._tle_cache', {}), \
+         patch('utils.weather_sat_predict.wgs84') as mock_wgs84, \
+         patch('utils.weather_sat_predict._get_satellite',
+               return_value=mock_satellite) as mock_get_satellite, \
+         patch('utils.weather_sat_predict._find_horizon_crossings') as mock_crossings:
+        yield SimpleNamespace(
+            crossings=mock_crossings,
+            get_satellite=mock_get_satellite,
+            satellite=mock_satellite,
+            satellites=satellites,
+            set_elevation=set_elevation,
+            tle=mock_tle,
+            wgs84=mock_wgs84,
+        )
+
+
+class TestPredictPasses:
+    """Tests for predict_passes() function."""
+
+    def test_predict_passes_no_tle_data(self, predict_mocks):
+        """predict_passes() should handle missing TLE data."""
+        predict_mocks.tle.get.return_value = None
+
+        passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
+
+        assert passes == []
+        predict_mocks.get_satellite.assert_not_called()
+
+    def test_predict_passes_basic(self, predict_mocks):
+        """predict_passes() should predict basic passes."""
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
@@ -95,108 +124,21 @@ class TestPredictPasses:
         assert 'duration' in pass_data
         assert 'quality' in pass_data
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_below_min_elevation(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_below_min_elevation(self, predict_mocks):
         """predict_passes() should filter passes below min elevation."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        # Mock low elevation pass
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 10.0  # Below min_elevation of 15
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(10.0)  # Below min_elevation of 15
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
         assert len(passes) == 0
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_with_trajectory(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_with_trajectory(self, predict_mocks):
         """predict_passes() should include trajectory when requested."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 45.0
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)
 
         passes = predict_passes(
             lat=51.5, lon=-0.1, hours=24, min_elevation=15, include_trajectory=True
@@ -206,71 +148,17 @@ class TestPredictPasses:
         assert 'trajectory' in passes[0]
         assert len(passes[0]['trajectory']) == 30
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_with_ground_track(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_with_ground_track(self, predict_mocks):
         """predict_passes() should include ground track when requested."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 45.0
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
-
-        # Mock geocentric position
-        def mock_at(t):
-            geocentric = MagicMock()
-            return geocentric
-
-        mock_satellite_obj.at.side_effect = mock_at
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)
 
         # Mock subpoint
         mock_subpoint = MagicMock()
-        mock_lat = MagicMock()
-        mock_lat.degrees = 51.5
-        mock_lon = MagicMock()
-        mock_lon.degrees = -0.1
-        mock_subpoint.latitude = mock_lat
-        mock_subpoint.longitude = mock_lon
-        mock_wgs84.subpoint.return_value = mock_subpoint
+        mock_subpoint.latitude.degrees = np.full(60, 51.5)
+        mock_subpoint.longitude.degrees = np.full(60, -0.1)
+        predict_mocks.wgs84.subpoint.return_value = mock_subpoint
 
         passes = predict_passes(
             lat=51.5, lon=-0.1, hours=24, min_elevation=15, include_ground_track=True
@@ -280,54 +168,11 @@ class TestPredictPasses:
         assert 'groundTrack' in passes[0]
         assert len(passes[0]['groundTrack']) == 60
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_quality_excellent(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_quality_excellent(self, predict_mocks):
         """predict_passes() should mark high elevation passes as excellent."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 75.0  # Excellent pass
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(75.0)  # Excellent pass
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
@@ -335,54 +180,11 @@ class TestPredictPasses:
         assert passes[0]['quality'] == 'excellent'
         assert passes[0]['maxEl'] >= 60
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_quality_good(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_quality_good(self, predict_mocks):
         """predict_passes() should mark medium elevation passes as good."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 45.0  # Good pass
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)  # Good pass
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
@@ -390,54 +192,11 @@ class TestPredictPasses:
         assert passes[0]['quality'] == 'good'
         assert 30 <= passes[0]['maxEl'] < 60
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_quality_fair(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_quality_fair(self, predict_mocks):
         """predict_passes() should mark low elevation passes as fair."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 20.0  # Fair pass
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(20.0)  # Fair pass
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
@@ -445,213 +204,67 @@ class TestPredictPasses:
         assert passes[0]['quality'] == 'fair'
         assert passes[0]['maxEl'] < 30
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_inactive_satellite(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_predict_passes_inactive_satellite(self, predict_mocks):
         """predict_passes() should skip inactive satellites."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_load.timescale.return_value = mock_ts
-
-        # Temporarily mark satellite as inactive
-        from utils.weather_sat import WEATHER_SATELLITES
-        original_active = WEATHER_SATELLITES['NOAA-18']['active']
-        WEATHER_SATELLITES['NOAA-18']['active'] = False
-
-        try:
-            passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
-            # Should not include NOAA-18
-            noaa_18_passes = [p for p in passes if p['satellite'] == 'NOAA-18']
-            assert len(noaa_18_passes) == 0
-        finally:
-            WEATHER_SATELLITES['NOAA-18']['active'] = original_active
-
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_exception_handling(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
-        """predict_passes() should handle exceptions gracefully."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)
+        predict_mocks.satellites['NOAA-18']['active'] = False
 
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
+        passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
+        # Should not include NOAA-18
+        noaa_18_passes = [p for p in passes if p['satellite'] == 'NOAA-18']
+        assert len(noaa_18_passes) == 0
+        predict_mocks.crossings.assert_not_called()
 
-        # Make find_discrete raise exception
-        mock_find.side_effect = Exception('Computation error')
+    def test_predict_passes_exception_handling(self, predict_mocks):
+        """predict_passes() should handle exceptions gracefully."""
+        # Make the crossing search raise
+        predict_mocks.crossings.side_effect = Exception('Computation error')
 
         # Should not raise, just skip this satellite
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
-        # May include passes from other satellites or be empty
-        assert isinstance(passes, list)
+        assert passes == []
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    def test_predict_passes_uses_tle_cache(self, mock_tle, mock_load):
+    def test_predict_passes_uses_tle_cache(self, predict_mocks):
         """predict_passes() should use live TLE cache if available."""
-        with patch('utils.weather_sat_predict._tle_cache', {'NOAA-18': ('NOAA-18', 'line1', 'line2')}):
-            mock_ts = MagicMock()
-            mock_ts.now.return_value = MagicMock()
-            mock_ts.utc.return_value = MagicMock()
-            mock_load.timescale.return_value = mock_ts
-
-            # Even though TLE_SATELLITES is mocked, should use _tle_cache
-            with patch('utils.weather_sat_predict.wgs84'), \
-                 patch('utils.weather_sat_predict.EarthSatellite'), \
-                 patch('utils.weather_sat_predict.find_discrete', return_value=([], [])):
-
-                passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
-                # Should not raise
-
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_predict_passes_sorted_by_time(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
-        """predict_passes() should return passes sorted by start time."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: self._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
+        cached_tle = ('NOAA-18', 'line1', 'line2')
+        predict_mocks.crossings.return_value = ([], [])
 
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
+        with patch('routes.satellite._tle_cache', {'NOAA-18': cached_tle}):
+            passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
-        # Two passes
-        rise1 = MagicMock()
-        rise1.utc_datetime.return_value = now + timedelta(hours=4)
-        set1 = MagicMock()
-        set1.utc_datetime.return_value = now + timedelta(hours=4, minutes=15)
-        rise2 = MagicMock()
-        rise2.utc_datetime.return_value = now + timedelta(hours=2)
-        set2 = MagicMock()
-        set2.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
+        # Even though TLE_SATELLITES is mocked, should use _tle_cache
+        assert passes == []
+        predict_mocks.tle.get.assert_not_called()
+        assert predict_mocks.get_satellite.call_args[0][:2] == ('NOAA-18', cached_tle)
 
+    def test_predict_passes_sorted_by_time(self, predict_mocks):
+        """predict_passes() should return passes sorted by start time."""
+        rise1, set1 = _pass_times(4)
+        rise2, set2 = _pass_times(2)
         # Return in non-chronological order
-        mock_find.return_value = ([rise1, set1, rise2, set2], [True, False, True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 45.0
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        predict_mocks.crossings.return_value = (
+            [rise1, set1, rise2, set2], [True, False, True, False]
+        )
+        predict_mocks.set_elevation(45.0)
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
         # Should be sorted with earliest pass first
-        if len(passes) >= 2:
-            assert passes[0]['startTimeISO'] < passes[1]['startTimeISO']
-
-    @staticmethod
-    def _mock_time(dt):
-        """Helper to create mock time object."""
-        mock_t = MagicMock()
-        if isinstance(dt, datetime):
-            mock_t.utc_datetime.return_value = dt
-        else:
-            mock_t.utc_datetime.return_value = datetime.now(timezone.utc)
-        return mock_t
+        assert len(passes) == 2
+        assert passes[0]['startTimeISO'] < passes[1]['startTimeISO']
 
 
 class TestPassDataStructure:
     """Tests for pass data structure."""
 
-    @patch('utils.weather_sat_predict.load')
-    @patch('utils.weather_sat_predict.TLE_SATELLITES')
-    @patch('utils.weather_sat_predict.wgs84')
-    @patch('utils.weather_sat_predict.EarthSatellite')
-    @patch('utils.weather_sat_predict.find_discrete')
-    def test_pass_data_fields(
-        self, mock_find, mock_sat, mock_wgs84, mock_tle, mock_load
-    ):
+    def test_pass_data_fields(self, predict_mocks):
         """Pass data should contain all required fields."""
-        mock_ts = MagicMock()
-        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_now = MagicMock()
-        mock_now.utc_datetime.return_value = now
-        mock_ts.now.return_value = mock_now
-        mock_ts.utc.side_effect = lambda dt: TestPredictPasses._mock_time(dt)
-        mock_load.timescale.return_value = mock_ts
-
-        mock_tle.get.return_value = (
-            'NOAA-18',
-            '1 28654U 05018A   24001.50000000  .00000000  00000-0  00000-0 0  9999',
-            '2 28654  98.7000 100.0000 0001000   0.0000   0.0000 14.12500000000000'
-        )
-
-        mock_observer = MagicMock()
-        mock_wgs84.latlon.return_value = mock_observer
-
-        mock_satellite_obj = MagicMock()
-        mock_sat.return_value = mock_satellite_obj
-
-        rise_time = MagicMock()
-        rise_time.utc_datetime.return_value = now + timedelta(hours=2)
-        set_time = MagicMock()
-        set_time.utc_datetime.return_value = now + timedelta(hours=2, minutes=15)
-
-        mock_find.return_value = ([rise_time, set_time], [True, False])
-
-        def mock_topocentric(t):
-            topo = MagicMock()
-            alt = MagicMock()
-            alt.degrees = 45.0
-            az = MagicMock()
-            az.degrees = 180.0
-            topo.altaz.return_value = (alt, az, MagicMock())
-            return topo
-
-        mock_diff = MagicMock()
-        mock_diff.at.side_effect = mock_topocentric
-        mock_satellite_obj.__sub__.return_value = mock_diff
+        rise_time, set_time = _pass_times(2)
+        predict_mocks.crossings.return_value = ([rise_time, set_time], [True, False])
+        predict_mocks.set_elevation(45.0)
 
         passes = predict_passes(lat=51.5, lon=-0.1, hours=24, min_elevation=15)
 
@@ -670,6 +283,37 @@ class TestPassDataStructure:
 
     def test_import_error_propagates(self):
         """predict_passes() should raise ImportError if skyfield unavailable."""
-        with patch.dict('sys.modules', {'skyfield': None, 'skyfield.api': None}):
-            with pytest.raises((ImportError, AttributeError)):
+        with patch('utils.weather_sat_predict.SKYFIELD_AVAILABLE', False):
+            with pytest.raises(ImportError):
                 predict_passes(lat=51.5, lon=-0.1)
+
+
+class TestHorizonCrossings:
+    """Tests for the vectorized SGP4 horizon crossing search."""
+
+    def test_matches_find_discrete(self):
+        """Crossings should agree with skyfield's find_discrete search."""
+        pytest.importorskip('skyfield')
+        from skyfield.api import EarthSatellite, load, wgs84
+        from skyfield.almanac import find_discrete
+        from data.satellites import TLE_SATELLITES
+        from utils.weather_sat_predict import _find_horizon_crossings
+
+        ts = load.timescale()
+        name, line1, line2 = TLE_SATELLITES['METEOR-M2-3']
+        satellite = EarthSatellite(line1, line2, name, ts)
+        observer = wgs84.latlon(51.5, -0.1)
+        t0 = ts.utc(2026, 10, 15, 12)
+        t1 = ts.utc(2026, 10, 16, 12)
+
+        def above_horizon(t):
+            return (satellite - observer).at(t).altaz()[0].degrees > 0
+        above_horizon.step_days = 1 / 720
+
+        expected_times, expected_events = find_discrete(t0, t1, above_horizon)
+        times, events = _find_horizon_crossings(satellite, observer, ts, t0, t1)
+
+        assert list(events) == list(expected_events)
+        assert len(expected_times) > 0
+        for actual, expected in zip(times, expected_times):
+            assert abs(actual.tt - expected.tt) * 86400 < 0.1
@@ -15,6 +15,15 @@ from utils.weather_sat import WeatherSatImage, WEATHER_SATELLITES
 from datetime import datetime, timezone
 
 
+@pytest.fixture(autouse=True)
+def clear_passes_cache():
+    """Keep cached /passes responses from leaking between tests."""
+    from routes import weather_sat
+    weather_sat._passes_cache.clear()
+    yield
+    weather_sat._passes_cache.clear()
+
+
 class TestWeatherSatRoutes:
     """Tests for weather satellite routes."""
 
@@ -68,8 +77,7 @@ class TestWeatherSatRoutes:
     def test_start_capture_success(self, client):
         """POST /weather-sat/start successfully starts capture."""
         with patch('routes.weather_sat.is_weather_sat_available', return_value=True), \
-             patch('routes.weather_sat.get_weather_sat_decoder') as mock_get, \
-             patch('routes.weather_sat.queue.Queue') as mock_queue:
+             patch('routes.weather_sat.get_weather_sat_decoder') as mock_get:
 
             mock_decoder = MagicMock()
             mock_decoder.is_running = False
@@ -478,8 +486,7 @@ class TestWeatherSatRoutes:
     def test_get_image_success(self, client):
         """GET /weather-sat/images/<filename> serves image."""
         with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get, \
-             patch('routes.weather_sat.send_file') as mock_send, \
-             patch('pathlib.Path.exists', return_value=True):
+             patch('routes.weather_sat.send_from_directory') as mock_send:
 
             mock_decoder = MagicMock()
             mock_decoder._output_dir = Path('/tmp')
@@ -491,6 +498,44 @@ class TestWeatherSatRoutes:
             call_args = mock_send.call_args
             assert call_args[1]['mimetype'] == 'image/png'
 
+    def test_get_image_x_accel_redirect(self, client):
+        """GET /weather-sat/images/<filename> hands off to the proxy when configured."""
+        with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get, \
+             patch('routes.weather_sat.send_from_directory') as mock_send, \
+             patch('routes.weather_sat.WEATHER_SAT_X_ACCEL_PREFIX', '/_protected_images/'), \
+             patch('pathlib.Path.exists', return_value=True):
+
+            mock_decoder = MagicMock()
+            mock_decoder._output_dir = Path('/tmp')
+            mock_get.return_value = mock_decoder
+
+            response = client.get('/weather-sat/images/test_image.jpg')
+            assert response.status_code == 200
+            assert response.headers['X-Accel-Redirect'] == '/_protected_images/test_image.jpg'
+            assert response.mimetype == 'image/jpeg'
+            assert response.data == b''
+            mock_send.assert_not_called()
+
+    def test_get_image_conditional(self, client, tmp_path):
+        """GET /weather-sat/images/<filename> answers 304 for a cached image."""
+        (tmp_path / 'cached.png').write_bytes(b'\x89PNG\r\n\x1a\n')
+        with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get:
+            mock_decoder = MagicMock()
+            mock_decoder._output_dir = tmp_path
+            mock_get.return_value = mock_decoder
+
+            first = client.get('/weather-sat/images/cached.png')
+            assert first.status_code == 200
+            assert first.mimetype == 'image/png'
+            assert 'max-age=3600' in first.headers['Cache-Control']
+
+            second = client.get(
+                '/weather-sat/images/cached.png',
+                headers={'If-None-Match': first.headers['ETag']},
+            )
+            assert second.status_code == 304
+            first.close()
+
     def test_get_image_invalid_filename(self, client):
         """GET /weather-sat/images/<filename> with invalid filename."""
         with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get:
@@ -549,6 +594,19 @@ class TestWeatherSatRoutes:
             response = client.delete('/weather-sat/images/missing.png')
             assert response.status_code == 404
 
+    def test_delete_image_invalid_filename(self, client):
+        """DELETE /weather-sat/images/<filename> rejects dot-leading names."""
+        with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get:
+            mock_decoder = MagicMock()
+            mock_get.return_value = mock_decoder
+
+            response = client.delete('/weather-sat/images/.hidden.png')
+            assert response.status_code == 400
+            data = response.get_json()
+            assert data['status'] == 'error'
+            assert 'Invalid filename' in data['message']
+            mock_decoder.delete_image.assert_not_called()
+
     def test_delete_all_images(self, client):
         """DELETE /weather-sat/images deletes all images."""
         with patch('routes.weather_sat.get_weather_sat_decoder') as mock_get:
@@ -642,6 +700,18 @@ class TestWeatherSatRoutes:
             assert data['status'] == 'error'
             assert 'skyfield' in data['message']
 
+    def test_get_passes_cached(self, client):
+        """GET /weather-sat/passes reuses a fresh result for the same query."""
+        with patch('routes.weather_sat.predict_passes', return_value=[]) as mock_predict:
+            first = client.get('/weather-sat/passes?latitude=51.5&longitude=-0.1')
+            second = client.get('/weather-sat/passes?latitude=51.5&longitude=-0.1')
+            other = client.get('/weather-sat/passes?latitude=40.0&longitude=-0.1')
+
+            assert first.status_code == 200
+            assert second.get_json() == first.get_json()
+            assert other.status_code == 200
+            assert mock_predict.call_count == 2
+
     def test_get_passes_prediction_error(self, client):
         """GET /weather-sat/passes when prediction fails."""
         with patch('routes.weather_sat.predict_passes', side_effect=Exception('TLE error')):
@@ -799,3 +869,28 @@ class TestWeatherSatScheduler:
         data = response.get_json()
         assert data['status'] == 'error'
         assert 'Invalid pass ID' in data['message']
+
+
+class TestWeatherSatEventBroadcast:
+    """Tests for SSE event fan-out to connected clients."""
+
+    def test_publish_reaches_every_subscriber(self):
+        """Each subscriber gets the published event, formatted once."""
+        import threading
+        from collections import deque
+        from routes import weather_sat
+
+        subscribers = [(deque(), threading.Event()) for _ in range(2)]
+        with patch.object(weather_sat, '_subscribers', subscribers):
+            weather_sat._publish({'type': 'progress'})
+
+        for events, wakeup in subscribers:
+            assert list(events) == ['data: {"type": "progress"}\n\n']
+            assert wakeup.is_set()
+
+    def test_publish_without_subscribers(self):
+        """Publishing with no connected clients is a no-op."""
+        from routes import weather_sat
+
+        with patch.object(weather_sat, '_subscribers', []):
+            weather_sat._publish({'type': 'progress'})
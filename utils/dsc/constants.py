@@ -8,6 +8,23 @@ Identification Digits) country mappings.
 
 from __future__ import annotations
 
+# Lowest value of the format, nature and telecommand codes
+DSC_CODE_BASE = 100
+
+
+def _code_table(codes: dict[int, str]) -> tuple[str | None, ...]:
+    """Flatten a code map into a tuple indexed by code - DSC_CODE_BASE."""
+    return tuple(codes.get(code) for code in range(DSC_CODE_BASE, max(codes) + 1))
+
+
+def lookup_code(table: tuple[str | None, ...], code: object) -> str | None:
+    """Look up a code in a table built by _code_table, or None if absent."""
+    if isinstance(code, int):
+        index = code - DSC_CODE_BASE
+        if 0 <= index < len(table):
+            return table[index]
+    return None
+
 # =============================================================================
 # DSC Format Codes (Category)
 # Per ITU-R M.493-15 Table 1
@@ -27,6 +44,8 @@ FORMAT_CODES = {
     120: 'URGENCY',        # Urgency call
 }
 
+FORMAT_TABLE = _code_table(FORMAT_CODES)
+
 # Category priority (lower = higher priority)
 CATEGORY_PRIORITY = {
     'DISTRESS': 0,
@@ -42,6 +61,9 @@ CATEGORY_PRIORITY = {
     'INDIVIDUAL_ACK': 5,
 }
 
+# Categories flagged as critical alerts
+CRITICAL_CATEGORIES = frozenset({'DISTRESS', 'DISTRESS_ACK', 'DISTRESS_RELAY', 'URGENCY'})
+
 
 # =============================================================================
 # Nature of Distress Codes
@@ -63,6 +85,8 @@ DISTRESS_NATURE_CODES = {
     112: 'EPIRB',           # EPIRB emission
 }
 
+DISTRESS_NATURE_TABLE = _code_table(DISTRESS_NATURE_CODES)
+
 
 # =============================================================================
 # Telecommand Codes (First and Second)
@@ -93,6 +117,8 @@ TELECOMMAND_CODES = {
     201: 'POLL_RESPONSE',      # Poll response
 }
 
+TELECOMMAND_TABLE = _code_table(TELECOMMAND_CODES)
+
 
 # =============================================================================
 # DSC Symbol Definitions
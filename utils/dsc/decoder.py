@@ -40,8 +40,9 @@ from .constants import (
     DSC_MARK_FREQ,
     DSC_SPACE_FREQ,
     DSC_AUDIO_SAMPLE_RATE,
-    FORMAT_CODES,
-    DISTRESS_NATURE_CODES,
+    FORMAT_TABLE,
+    DISTRESS_NATURE_TABLE,
+    lookup_code,
 )
 
 # Configure logging
@@ -321,7 +322,7 @@ class DSCDecoder:
         try:
             # Format specifier (first non-phasing symbol)
             format_code = symbols[0]
-            format_text = FORMAT_CODES.get(format_code, f'UNKNOWN-{format_code}')
+            format_text = lookup_code(FORMAT_TABLE, format_code) or f'UNKNOWN-{format_code}'
 
             # Determine category from format
             category = 'ROUTINE'
@@ -361,8 +362,9 @@ class DSCDecoder:
                 # Distress messages have nature and position
                 if len(remaining) >= 1:
                     message['nature'] = remaining[0]
-                    message['nature_text'] = DISTRESS_NATURE_CODES.get(
-                        remaining[0], f'UNKNOWN-{remaining[0]}'
+                    message['nature_text'] = (
+                        lookup_code(DISTRESS_NATURE_TABLE, remaining[0])
+                        or f'UNKNOWN-{remaining[0]}'
                     )
 
                 # Try to decode position
@@ -9,21 +9,25 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from .constants import (
-    FORMAT_CODES,
-    DISTRESS_NATURE_CODES,
-    TELECOMMAND_CODES,
+    FORMAT_TABLE,
+    DISTRESS_NATURE_TABLE,
+    TELECOMMAND_TABLE,
     CATEGORY_PRIORITY,
+    CRITICAL_CATEGORIES,
     MID_COUNTRY_MAP,
+    lookup_code,
 )
 
 logger = logging.getLogger('intercept.dsc.parser')
 
 
+# Receivers tend to see the same stations repeatedly
+@lru_cache(maxsize=4096)
 def get_country_from_mmsi(mmsi: str) -> str | None:
     """
     Derive country from MMSI using Maritime Identification Digits (MID).
@@ -40,23 +44,17 @@ def get_country_from_mmsi(mmsi: str) -> str | None:
         return None
 
     # Normal ship MMSI: starts with MID (3 digits)
-    mid = mmsi[:3]
-    if mid in MID_COUNTRY_MAP:
-        return MID_COUNTRY_MAP[mid]
+    if mmsi[0] != '0':
+        return MID_COUNTRY_MAP.get(mmsi[:3])
 
     # Coast station MMSI: starts with 00 + MID
-    if mmsi.startswith('00') and len(mmsi) >= 5:
-        mid = mmsi[2:5]
-        if mid in MID_COUNTRY_MAP:
-            return MID_COUNTRY_MAP[mid]
+    if mmsi[1] == '0':
+        country = MID_COUNTRY_MAP.get(mmsi[2:5])
+        if country:
+            return country
 
     # Group ship station MMSI: starts with 0 + MID
-    if mmsi.startswith('0') and len(mmsi) >= 4:
-        mid = mmsi[1:4]
-        if mid in MID_COUNTRY_MAP:
-            return MID_COUNTRY_MAP[mid]
-
-    return None
+    return MID_COUNTRY_MAP.get(mmsi[1:4])
 
 
 def get_distress_nature_text(code: int | str) -> str:
@@ -67,7 +65,7 @@ def get_distress_nature_text(code: int | str) -> str:
         except ValueError:
             return str(code)
 
-    return DISTRESS_NATURE_CODES.get(code, f'UNKNOWN ({code})')
+    return lookup_code(DISTRESS_NATURE_TABLE, code) or f'UNKNOWN ({code})'
 
 
 def get_format_text(code: int | str) -> str:
@@ -78,7 +76,7 @@ def get_format_text(code: int | str) -> str:
         except ValueError:
             return str(code)
 
-    return FORMAT_CODES.get(code, f'UNKNOWN ({code})')
+    return lookup_code(FORMAT_TABLE, code) or f'UNKNOWN ({code})'
 
 
 def get_telecommand_text(code: int | str) -> str:
@@ -89,7 +87,7 @@ def get_telecommand_text(code: int | str) -> str:
         except ValueError:
             return str(code)
 
-    return TELECOMMAND_CODES.get(code, f'UNKNOWN ({code})')
+    return lookup_code(TELECOMMAND_TABLE, code) or f'UNKNOWN ({code})'
 
 
 def get_category_priority(category: str) -> int:
@@ -193,11 +191,12 @@ def parse_dsc_message(raw_line: str) -> dict[str, Any] | None:
     if 'raw' in data:
         msg['raw_message'] = data['raw']
 
-    # Calculate priority
-    msg['priority'] = get_category_priority(msg['category'])
+    # Calculate priority (category is already upper-cased)
+    category = msg['category']
+    msg['priority'] = CATEGORY_PRIORITY.get(category, 10)
 
     # Mark if this is a critical alert
-    msg['is_critical'] = msg['category'] in ('DISTRESS', 'DISTRESS_ACK', 'DISTRESS_RELAY', 'URGENCY')
+    msg['is_critical'] = category in CRITICAL_CATEGORIES
 
     return msg
 
@@ -271,8 +270,8 @@ def validate_mmsi(mmsi: str) -> bool:
     if not mmsi:
         return False
 
-    # Must be 9 digits
-    if not re.match(r'^\d{9}$', mmsi):
+    # Must be 9 digits (isdecimal accepts the same characters as regex \d)
+    if len(mmsi) != 9 or not mmsi.isdecimal():
         return False
 
     # All zeros is invalid
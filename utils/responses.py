@@ -0,0 +1,46 @@
+"""JSON response helpers for hot or precomputed API payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from flask import Response
+
+# orjson is optional; it encodes straight to UTF-8 bytes and is several
+# times faster than the stdlib encoder used by jsonify.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response without going through jsonify.
+
+    Args:
+        obj: JSON-serializable object, or bytes that are already encoded
+        status: HTTP status code
+
+    Returns:
+        Flask Response with application/json mimetype
+    """
+    body = obj if isinstance(obj, bytes) else dumps_json(obj)
+    return Response(body, status=status, mimetype='application/json')
@@ -10,10 +10,18 @@ All outputs use hedged language - never claims certainty, uses
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # Confidence Levels
@@ -26,6 +34,39 @@ class Confidence(Enum):
     HIGH = "HIGH"
 
 
+# =============================================================================
+# Region / Modulation Match Masks
+# =============================================================================
+
+# One bit per region; a signal type matches a region if they share a bit or
+# the signal type is GLOBAL
+REGION_BITS = {"UK/EU": 1, "US": 2, "GLOBAL": 4}
+GLOBAL_REGION_BIT = REGION_BITS["GLOBAL"]
+
+# Upper-cased modulation hint -> bit, assigned as signal types are defined
+_MODULATION_HINT_BITS: dict[str, int] = {}
+
+
+def _modulation_hint_bit(hint: str) -> int:
+    """Get the bit for an upper-cased modulation hint, assigning one if new."""
+    bit = _MODULATION_HINT_BITS.get(hint)
+    if bit is None:
+        bit = 1 << len(_MODULATION_HINT_BITS)
+        _MODULATION_HINT_BITS[hint] = bit
+        _modulation_mask.cache_clear()
+    return bit
+
+
+@lru_cache(maxsize=256)
+def _modulation_mask(mod_upper: str) -> int:
+    """Bits of all known hints that match a modulation (substring either way)."""
+    mask = 0
+    for hint, bit in _MODULATION_HINT_BITS.items():
+        if hint in mod_upper or mod_upper in hint:
+            mask |= bit
+    return mask
+
+
 # =============================================================================
 # Signal Type Definitions
 # =============================================================================
@@ -48,6 +89,20 @@ class SignalTypeDefinition:
     is_burst_type: bool = False
     # Region applicability
     regions: list[str] = field(default_factory=lambda: ["UK/EU", "US", "GLOBAL"])
+    # Match masks derived from regions and modulation_hints
+    region_mask: int = field(init=False, repr=False, compare=False)
+    modulation_mask: int = field(init=False, repr=False, compare=False)
+    # Lower-cased description, as embedded in explanations
+    description_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.description_lower = self.description.lower()
+        self.region_mask = 0
+        for region in self.regions:
+            self.region_mask |= REGION_BITS.get(region, 0)
+        self.modulation_mask = 0
+        for hint in self.modulation_hints:
+            self.modulation_mask |= _modulation_hint_bit(hint.upper())
 
 
 # =============================================================================
@@ -378,11 +433,53 @@ SIGNAL_TYPES: list[SignalTypeDefinition] = [
 ]
 
 
+def _build_frequency_index(
+    signal_types: list[SignalTypeDefinition],
+) -> tuple[list[int], list[tuple[SignalTypeDefinition, ...]]]:
+    """
+    Split the spectrum into segments covered by a fixed set of signal types.
+
+    Returns sorted segment start frequencies and, for each segment, the signal
+    types whose ranges cover it (in table order). Segment i spans
+    [edges[i], edges[i + 1]).
+    """
+    edges = sorted({
+        edge
+        for signal_type in signal_types
+        for freq_min, freq_max in signal_type.frequency_ranges
+        for edge in (freq_min, freq_max + 1)
+    })
+    segments = [
+        tuple(
+            signal_type for signal_type in signal_types
+            if any(freq_min <= start <= freq_max
+                   for freq_min, freq_max in signal_type.frequency_ranges)
+        )
+        for start in edges
+    ]
+    return edges, segments
+
+
+# The index depends only on SIGNAL_TYPES, so every engine shares one copy
+_SEGMENT_EDGES, _SEGMENT_TYPES = _build_frequency_index(SIGNAL_TYPES)
+
+
+def _normalize_region(region: str | None) -> str:
+    """
+    Map a region name onto REGION_BITS.
+
+    Unknown names and None score exactly like "GLOBAL" (only globally
+    allocated types match), so they are folded into it before reaching
+    the per-region caches.
+    """
+    return region if region in REGION_BITS else "GLOBAL"
+
+
 # =============================================================================
 # Signal Guess Result
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SignalAlternative:
     """An alternative signal type guess."""
     label: str
@@ -390,7 +487,7 @@ class SignalAlternative:
     score: int
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SignalGuessResult:
     """Complete signal guess result with hedged language."""
     primary_label: str
@@ -399,7 +496,25 @@ class SignalGuessResult:
     explanation: str
     tags: list[str]
     # Internal scoring data (useful for debugging/testing)
-    _scores: dict[str, int] = field(default_factory=dict, repr=False)
+    _scores: Mapping[str, int] = field(
+        default_factory=lambda: MappingProxyType({}), repr=False
+    )
+
+    def to_dict(self) -> dict:
+        """Convert to a fresh dict for JSON serialization."""
+        return {
+            "primary_label": self.primary_label,
+            "confidence": self.confidence.value,
+            "alternatives": [
+                {
+                    "label": alt.label,
+                    "confidence": alt.confidence.value,
+                }
+                for alt in self.alternatives
+            ],
+            "explanation": self.explanation,
+            "tags": list(self.tags),
+        }
 
 
 # =============================================================================
@@ -426,6 +541,15 @@ class SignalGuessingEngine:
         """
         self.region = region
         self._signal_types = SIGNAL_TYPES
+        self._segment_edges = _SEGMENT_EDGES
+        self._segment_types = _SEGMENT_TYPES
+
+    def _candidates(self, frequency_hz: int) -> tuple[SignalTypeDefinition, ...]:
+        """Signal types with a frequency range covering frequency_hz."""
+        i = bisect_right(self._segment_edges, frequency_hz) - 1
+        if i < 0:
+            return ()
+        return self._segment_types[i]
 
     def guess_signal_type(
         self,
@@ -458,7 +582,7 @@ class SignalGuessingEngine:
         scores: dict[str, int] = {}
         matched_types: dict[str, SignalTypeDefinition] = {}
 
-        for signal_type in self._signal_types:
+        for signal_type in self._candidates(frequency_hz):
             score = self._score_signal_type(
                 signal_type,
                 frequency_hz,
@@ -480,7 +604,6 @@ class SignalGuessingEngine:
                 alternatives=[],
                 explanation=self._build_unknown_explanation(frequency_hz, modulation),
                 tags=["unknown"],
-                _scores={},
             )
 
         # Sort by score descending
@@ -532,7 +655,7 @@ class SignalGuessingEngine:
             alternatives=alternatives,
             explanation=explanation,
             tags=primary_type.tags.copy(),
-            _scores=scores,
+            _scores=MappingProxyType(scores),
         )
 
     def _score_signal_type(
@@ -549,7 +672,7 @@ class SignalGuessingEngine:
         score = 0
 
         # Check region applicability
-        if region not in signal_type.regions and "GLOBAL" not in signal_type.regions:
+        if not signal_type.region_mask & (REGION_BITS.get(region, 0) | GLOBAL_REGION_BIT):
             return 0
 
         # Check frequency match (required)
@@ -566,12 +689,8 @@ class SignalGuessingEngine:
         score = signal_type.base_score
 
         # Modulation bonus
-        if modulation:
-            mod_upper = modulation.upper()
-            for hint in signal_type.modulation_hints:
-                if hint.upper() in mod_upper or mod_upper in hint.upper():
-                    score += 5
-                    break
+        if modulation and signal_type.modulation_mask & _modulation_mask(modulation.upper()):
+            score += 5
 
         # Bandwidth bonus/penalty
         if bandwidth_hz and signal_type.bandwidth_range:
@@ -659,14 +778,15 @@ class SignalGuessingEngine:
     ) -> str:
         """Build a hedged, client-safe explanation."""
         freq_mhz = frequency_hz / 1_000_000
+        description = signal_type.description_lower
 
         # Start with frequency observation
         if confidence == Confidence.HIGH:
-            explanation = f"Frequency of {freq_mhz:.3f} MHz is consistent with {signal_type.description.lower()}."
+            explanation = f"Frequency of {freq_mhz:.3f} MHz is consistent with {description}."
         elif confidence == Confidence.MEDIUM:
-            explanation = f"Frequency of {freq_mhz:.3f} MHz could indicate {signal_type.description.lower()}."
+            explanation = f"Frequency of {freq_mhz:.3f} MHz could indicate {description}."
         else:
-            explanation = f"Frequency of {freq_mhz:.3f} MHz may be associated with {signal_type.description.lower()}."
+            explanation = f"Frequency of {freq_mhz:.3f} MHz may be associated with {description}."
 
         # Add supporting evidence
         evidence = []
@@ -716,17 +836,12 @@ class SignalGuessingEngine:
 
         Useful for displaying what services could operate at a given frequency.
         """
-        effective_region = region or self.region
+        region_bits = REGION_BITS.get(region or self.region, 0) | GLOBAL_REGION_BIT
         allocations = []
 
-        for signal_type in self._signal_types:
-            if effective_region not in signal_type.regions and "GLOBAL" not in signal_type.regions:
-                continue
-
-            for freq_min, freq_max in signal_type.frequency_ranges:
-                if freq_min <= frequency_hz <= freq_max:
-                    allocations.append(signal_type.label)
-                    break
+        for signal_type in self._candidates(frequency_hz):
+            if signal_type.region_mask & region_bits:
+                allocations.append(signal_type.label)
 
         return allocations
 
@@ -735,16 +850,35 @@ class SignalGuessingEngine:
 # Convenience Functions
 # =============================================================================
 
-# Default engine instance
-_default_engine: Optional[SignalGuessingEngine] = None
+def get_engine(region: str = "UK/EU") -> SignalGuessingEngine:
+    """Get or create the engine instance for a region."""
+    return _get_region_engine(_normalize_region(region))
+
 
+@lru_cache(maxsize=len(REGION_BITS))
+def _get_region_engine(region: str) -> SignalGuessingEngine:
+    # One engine per known region, so alternating regions does not rebuild it
+    return SignalGuessingEngine(region=region)
 
-def get_engine(region: str = "UK/EU") -> SignalGuessingEngine:
-    """Get or create the default engine instance."""
-    global _default_engine
-    if _default_engine is None or _default_engine.region != region:
-        _default_engine = SignalGuessingEngine(region=region)
-    return _default_engine
+
+@lru_cache(maxsize=4096)
+def _guess_signal_type_cached(
+    frequency_hz: int,
+    modulation: str | None,
+    bandwidth_hz: int | None,
+    duration_ms: int | None,
+    repetition_count: int | None,
+    region: str,
+) -> SignalGuessResult:
+    """Score a signal once per distinct set of inputs."""
+    return get_engine(region).guess_signal_type(
+        frequency_hz=frequency_hz,
+        modulation=modulation,
+        bandwidth_hz=bandwidth_hz,
+        duration_ms=duration_ms,
+        repetition_count=repetition_count,
+        region=region,
+    )
 
 
 def guess_signal_type(
@@ -759,17 +893,28 @@ def guess_signal_type(
     """
     Convenience function to guess signal type.
 
+    Results are cached per input; rssi_dbm does not affect scoring and is
+    not part of the cache key.
+
     See SignalGuessingEngine.guess_signal_type for full documentation.
     """
-    engine = get_engine(region)
-    return engine.guess_signal_type(
-        frequency_hz=frequency_hz,
-        modulation=modulation,
-        bandwidth_hz=bandwidth_hz,
-        duration_ms=duration_ms,
-        repetition_count=repetition_count,
-        rssi_dbm=rssi_dbm,
-        region=region,
+    result = _guess_signal_type_cached(
+        frequency_hz,
+        modulation,
+        bandwidth_hz,
+        duration_ms,
+        repetition_count,
+        _normalize_region(region),
+    )
+    # Fresh lists so callers cannot alter the cached result; _scores is
+    # already read-only
+    return SignalGuessResult(
+        primary_label=result.primary_label,
+        confidence=result.confidence,
+        alternatives=list(result.alternatives),
+        explanation=result.explanation,
+        tags=list(result.tags),
+        _scores=result._scores,
     )
 
 
@@ -785,26 +930,12 @@ def guess_signal_type_dict(
     """
     Convenience function returning dict (for JSON serialization).
     """
-    result = guess_signal_type(
-        frequency_hz=frequency_hz,
-        modulation=modulation,
-        bandwidth_hz=bandwidth_hz,
-        duration_ms=duration_ms,
-        repetition_count=repetition_count,
-        rssi_dbm=rssi_dbm,
-        region=region,
-    )
-
-    return {
-        "primary_label": result.primary_label,
-        "confidence": result.confidence.value,
-        "alternatives": [
-            {
-                "label": alt.label,
-                "confidence": alt.confidence.value,
-            }
-            for alt in result.alternatives
-        ],
-        "explanation": result.explanation,
-        "tags": result.tags,
-    }
+    # to_dict builds fresh containers, so the cached result is read directly
+    return _guess_signal_type_cached(
+        frequency_hz,
+        modulation,
+        bandwidth_hz,
+        duration_ms,
+        repetition_count,
+        _normalize_region(region),
+    ).to_dict()
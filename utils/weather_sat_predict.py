@@ -6,13 +6,241 @@ Shared prediction logic used by both the API endpoint and the auto-scheduler.
 from __future__ import annotations
 
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from data.satellites import TLE_SATELLITES
 from utils.logging import get_logger
 from utils.weather_sat import WEATHER_SATELLITES
 
+# skyfield is optional - only needed for pass prediction
+try:
+    import numpy as np
+    from skyfield.api import EarthSatellite, load, wgs84
+    from skyfield.sgp4lib import TEME_to_ITRF
+    SKYFIELD_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    EarthSatellite = None  # type: ignore
+    load = None  # type: ignore
+    wgs84 = None  # type: ignore
+    TEME_to_ITRF = None  # type: ignore
+    SKYFIELD_AVAILABLE = False
+
 logger = get_logger('intercept.weather_sat_predict')
 
+# Timescale and parsed satellites are reused across predictions; a cached
+# satellite is rebuilt only when its TLE lines change
+# (sgp4's C++ propagator holds the GIL, so concurrent calls that share a
+# satellite never interleave inside it)
+_timescale = None
+_satellite_cache: dict[str, tuple[tuple[str, str], Any]] = {}
+_cache_lock = threading.Lock()
+
+# Upper bound on threads predicting satellites concurrently within one call
+PASS_PREDICTION_WORKERS = 4
+
+
+def _get_timescale():
+    """Return the shared skyfield timescale, loading it on first use."""
+    global _timescale
+    with _cache_lock:
+        if _timescale is None:
+            _timescale = load.timescale()
+        return _timescale
+
+
+def _get_satellite(tle_key: str, tle_data: tuple[str, str, str], ts):
+    """Return a cached EarthSatellite for a TLE, parsing it if new or changed."""
+    lines = (tle_data[1], tle_data[2])
+    with _cache_lock:
+        cached = _satellite_cache.get(tle_key)
+        if cached is not None and cached[0] == lines:
+            return cached[1]
+        satellite = EarthSatellite(tle_data[1], tle_data[2], tle_data[0], ts)
+        _satellite_cache[tle_key] = (lines, satellite)
+        return satellite
+
+
+# Horizon crossings are found by sampling every minute straight from SGP4,
+# then bisecting each sign change; 16 rounds narrow 60 s to about 1 ms
+_HORIZON_STEP_DAYS = 60 / 86400
+_HORIZON_BISECTIONS = 16
+_UNIX_EPOCH_JD = 2440587.5
+
+
+def _find_horizon_crossings(satellite, observer, ts, t0, t1):
+    """Find when a satellite rises above or sets below the horizon.
+
+    Positions come from the satellite's SGP4 model in batches and are rotated
+    from TEME to the Earth-fixed frame directly, skipping the per-sample
+    precession and nutation that skyfield's altaz() computes. UT1 is taken
+    as UTC for the Earth rotation, which shifts crossings by well under a
+    second.
+
+    Args:
+        satellite: Skyfield EarthSatellite
+        observer: Skyfield wgs84 observer position
+        ts: Skyfield timescale
+        t0: Start of the search window
+        t1: End of the search window
+
+    Returns:
+        Tuple of (crossing times, rising flags), one entry per crossing.
+    """
+    model = satellite.model
+    observer_km = observer.itrs_xyz.km
+    lat = observer.latitude.radians
+    lon = observer.longitude.radians
+    up = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+    # SGP4 works in UTC Julian dates; TT - UTC is constant across the window
+    utc0 = _UNIX_EPOCH_JD + t0.utc_datetime().timestamp() / 86400
+    tt_minus_utc = t0.tt - utc0
+
+    def above(jd_utc):
+        whole = np.floor(jd_utc)
+        fraction = jd_utc - whole
+        _, r, v = model.sgp4_array(whole, fraction)
+        r_itrf, _ = TEME_to_ITRF(whole, r.T, v.T, fraction_ut1=fraction)
+        return up @ (r_itrf - observer_km[:, None]) > 0
+
+    jd = np.append(np.arange(utc0, t1.tt - tt_minus_utc, _HORIZON_STEP_DAYS),
+                   t1.tt - tt_minus_utc)
+    state = above(jd)
+
+    edges = np.flatnonzero(state[:-1] != state[1:])
+    if not len(edges):
+        return [], []
+
+    rising = state[edges + 1]
+    lo = jd[edges]
+    hi = jd[edges + 1]
+    for _ in range(_HORIZON_BISECTIONS):
+        mid = (lo + hi) / 2
+        crossed = above(mid) == rising
+        hi = np.where(crossed, mid, hi)
+        lo = np.where(crossed, lo, mid)
+
+    return ts.tt_jd(hi + tt_minus_utc), rising
+
+
+def _predict_satellite_passes(
+    sat_key: str,
+    sat_info: dict[str, Any],
+    satellite,
+    observer,
+    ts,
+    t0,
+    t1,
+    min_elevation: float,
+    include_trajectory: bool,
+    include_ground_track: bool,
+) -> list[dict[str, Any]]:
+    """Predict the passes of one satellite; see predict_passes()."""
+    try:
+        times, events = _find_horizon_crossings(satellite, observer, ts, t0, t1)
+    except Exception:
+        return []
+
+    diff = satellite - observer
+    passes: list[dict[str, Any]] = []
+
+    i = 0
+    while i < len(times):
+        if i < len(events) and events[i]:  # Rising
+            rise_time = times[i]
+            set_time = None
+
+            for j in range(i + 1, len(times)):
+                if not events[j]:  # Setting
+                    set_time = times[j]
+                    i = j
+                    break
+            else:
+                i += 1
+                continue
+
+            if set_time is None:
+                i += 1
+                continue
+
+            duration_seconds = (
+                set_time.utc_datetime() - rise_time.utc_datetime()
+            ).total_seconds()
+            duration_minutes = round(duration_seconds / 60, 1)
+
+            # Calculate max elevation and trajectory in one vectorized
+            # evaluation over evenly spaced points across the pass
+            num_traj_points = 30
+            t_points = ts.tt_jd(
+                rise_time.tt
+                + (set_time.tt - rise_time.tt) * np.linspace(0.0, 1.0, num_traj_points)
+            )
+            alt, az, _ = diff.at(t_points).altaz()
+            alt_deg = alt.degrees
+            az_deg = az.degrees
+
+            peak = int(np.argmax(alt_deg))
+            max_el = 0.0
+            max_el_az = 0.0
+            if alt_deg[peak] > 0:
+                max_el = float(alt_deg[peak])
+                max_el_az = float(az_deg[peak])
+
+            if max_el < min_elevation:
+                i += 1
+                continue
+
+            # Rise/set azimuths
+            _, edge_az, _ = diff.at(ts.tt_jd([rise_time.tt, set_time.tt])).altaz()
+            rise_az, set_az = edge_az.degrees
+
+            pass_data: dict[str, Any] = {
+                'id': f"{sat_key}_{rise_time.utc_datetime().strftime('%Y%m%d%H%M')}",
+                'satellite': sat_key,
+                'name': sat_info['name'],
+                'frequency': sat_info['frequency'],
+                'mode': sat_info['mode'],
+                'startTime': rise_time.utc_datetime().strftime('%Y-%m-%d %H:%M UTC'),
+                'startTimeISO': rise_time.utc_datetime().isoformat(),
+                'endTimeISO': set_time.utc_datetime().isoformat(),
+                'maxEl': round(max_el, 1),
+                'maxElAz': round(max_el_az, 1),
+                'riseAz': round(float(rise_az), 1),
+                'setAz': round(float(set_az), 1),
+                'duration': duration_minutes,
+                'quality': (
+                    'excellent' if max_el >= 60
+                    else 'good' if max_el >= 30
+                    else 'fair'
+                ),
+            }
+
+            if include_trajectory:
+                pass_data['trajectory'] = [
+                    {'el': float(max(0, el)), 'az': float(a)}
+                    for el, a in zip(alt_deg, az_deg)
+                ]
+
+            if include_ground_track:
+                t_track = ts.tt_jd(
+                    rise_time.tt
+                    + (set_time.tt - rise_time.tt) * np.linspace(0.0, 1.0, 60)
+                )
+                subpoint = wgs84.subpoint(satellite.at(t_track))
+                pass_data['groundTrack'] = [
+                    {'lat': float(la), 'lon': float(lo)}
+                    for la, lo in zip(subpoint.latitude.degrees, subpoint.longitude.degrees)
+                ]
+
+            passes.append(pass_data)
+
+        i += 1
+
+    return passes
+
 
 def predict_passes(
     lat: float,
@@ -38,9 +266,8 @@ def predict_passes(
     Raises:
         ImportError: If skyfield is not installed.
     """
-    from skyfield.api import load, wgs84, EarthSatellite
-    from skyfield.almanac import find_discrete
-    from data.satellites import TLE_SATELLITES
+    if not SKYFIELD_AVAILABLE:
+        raise ImportError('skyfield library not installed')
 
     # Use live TLE cache from satellite module if available (refreshed from CelesTrak)
     tle_source = TLE_SATELLITES
@@ -51,13 +278,12 @@ def predict_passes(
     except ImportError:
         pass
 
-    ts = load.timescale()
+    ts = _get_timescale()
     observer = wgs84.latlon(lat, lon)
     t0 = ts.now()
     t1 = ts.utc(t0.utc_datetime() + datetime.timedelta(hours=hours))
 
-    all_passes: list[dict[str, Any]] = []
-
+    jobs = []
     for sat_key, sat_info in WEATHER_SATELLITES.items():
         if not sat_info['active']:
             continue
@@ -66,123 +292,29 @@ def predict_passes(
         if not tle_data:
             continue
 
-        satellite = EarthSatellite(tle_data[1], tle_data[2], tle_data[0], ts)
+        satellite = _get_satellite(sat_info['tle_key'], tle_data, ts)
+        jobs.append((sat_key, sat_info, satellite))
 
-        def above_horizon(t, _sat=satellite):
-            diff = _sat - observer
-            topocentric = diff.at(t)
-            alt, _, _ = topocentric.altaz()
-            return alt.degrees > 0
-
-        above_horizon.step_days = 1 / 720
-
-        try:
-            times, events = find_discrete(t0, t1, above_horizon)
-        except Exception:
-            continue
-
-        i = 0
-        while i < len(times):
-            if i < len(events) and events[i]:  # Rising
-                rise_time = times[i]
-                set_time = None
-
-                for j in range(i + 1, len(times)):
-                    if not events[j]:  # Setting
-                        set_time = times[j]
-                        i = j
-                        break
-                else:
-                    i += 1
-                    continue
-
-                if set_time is None:
-                    i += 1
-                    continue
-
-                duration_seconds = (
-                    set_time.utc_datetime() - rise_time.utc_datetime()
-                ).total_seconds()
-                duration_minutes = round(duration_seconds / 60, 1)
-
-                # Calculate max elevation and trajectory
-                max_el = 0.0
-                max_el_az = 0.0
-                trajectory: list[dict[str, float]] = []
-                num_traj_points = 30
-
-                for k in range(num_traj_points):
-                    frac = k / (num_traj_points - 1)
-                    t_point = ts.utc(
-                        rise_time.utc_datetime()
-                        + datetime.timedelta(seconds=duration_seconds * frac)
-                    )
-                    diff = satellite - observer
-                    topocentric = diff.at(t_point)
-                    alt, az, _ = topocentric.altaz()
-                    if alt.degrees > max_el:
-                        max_el = alt.degrees
-                        max_el_az = az.degrees
-                    if include_trajectory:
-                        trajectory.append({
-                            'el': float(max(0, alt.degrees)),
-                            'az': float(az.degrees),
-                        })
-
-                if max_el < min_elevation:
-                    i += 1
-                    continue
-
-                # Rise/set azimuths
-                rise_topo = (satellite - observer).at(rise_time)
-                _, rise_az, _ = rise_topo.altaz()
-
-                set_topo = (satellite - observer).at(set_time)
-                _, set_az, _ = set_topo.altaz()
-
-                pass_data: dict[str, Any] = {
-                    'id': f"{sat_key}_{rise_time.utc_datetime().strftime('%Y%m%d%H%M')}",
-                    'satellite': sat_key,
-                    'name': sat_info['name'],
-                    'frequency': sat_info['frequency'],
-                    'mode': sat_info['mode'],
-                    'startTime': rise_time.utc_datetime().strftime('%Y-%m-%d %H:%M UTC'),
-                    'startTimeISO': rise_time.utc_datetime().isoformat(),
-                    'endTimeISO': set_time.utc_datetime().isoformat(),
-                    'maxEl': round(max_el, 1),
-                    'maxElAz': round(max_el_az, 1),
-                    'riseAz': round(rise_az.degrees, 1),
-                    'setAz': round(set_az.degrees, 1),
-                    'duration': duration_minutes,
-                    'quality': (
-                        'excellent' if max_el >= 60
-                        else 'good' if max_el >= 30
-                        else 'fair'
-                    ),
-                }
-
-                if include_trajectory:
-                    pass_data['trajectory'] = trajectory
-
-                if include_ground_track:
-                    ground_track: list[dict[str, float]] = []
-                    for k in range(60):
-                        frac = k / 59
-                        t_point = ts.utc(
-                            rise_time.utc_datetime()
-                            + datetime.timedelta(seconds=duration_seconds * frac)
-                        )
-                        geocentric = satellite.at(t_point)
-                        subpoint = wgs84.subpoint(geocentric)
-                        ground_track.append({
-                            'lat': float(subpoint.latitude.degrees),
-                            'lon': float(subpoint.longitude.degrees),
-                        })
-                    pass_data['groundTrack'] = ground_track
-
-                all_passes.append(pass_data)
-
-            i += 1
+    all_passes: list[dict[str, Any]] = []
+    if not jobs:
+        return all_passes
+
+    # Satellites are independent, so their passes are computed concurrently;
+    # each satellite is handled by exactly one worker of this call's pool
+    with ThreadPoolExecutor(
+        max_workers=min(PASS_PREDICTION_WORKERS, len(jobs)),
+        thread_name_prefix='weather-sat-predict',
+    ) as pool:
+        futures = [
+            pool.submit(
+                _predict_satellite_passes,
+                sat_key, sat_info, satellite, observer, ts, t0, t1,
+                min_elevation, include_trajectory, include_ground_track,
+            )
+            for sat_key, sat_info, satellite in jobs
+        ]
+        for future in futures:
+            all_passes.extend(future.result())
 
     all_passes.sort(key=lambda p: p['startTimeISO'])
     return all_passes